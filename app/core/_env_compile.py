@@ -0,0 +1,77 @@
+"""Compile a ``.env`` file into an importable ``.env.py`` module.
+
+Parsing ``.env`` as text happens on every process start. Deploy pipelines can
+run this module once to emit ``.env.py``, a plain dict literal that Python
+loads from its cached bytecode instead:
+
+    python -m app.core._env_compile [path/to/.env]
+
+The compiled module records the mtime of its source so a stale ``.env.py``
+is ignored once ``.env`` is edited.
+"""
+
+import importlib.util
+import os
+import pprint
+import sys
+from typing import Dict, Optional
+
+
+def compiled_path(env_path: str) -> str:
+    """Return the path of the compiled module for ``env_path``."""
+    return f"{env_path}.py"
+
+
+def compile_env(path: str = ".env") -> str:
+    """Transpile ``path`` into a ``.env.py`` module and return its path.
+
+    Args:
+        path: Path to the ``.env`` file
+
+    Returns:
+        str: Path of the generated module
+    """
+    from dotenv import dotenv_values
+
+    values = dict(dotenv_values(path))
+    source_mtime = os.stat(path).st_mtime_ns
+    target = compiled_path(path)
+
+    content = (
+        f'"""Generated from {os.path.basename(path)} by app.core._env_compile; do not edit."""\n'
+        "\n"
+        f"SOURCE_MTIME_NS = {source_mtime}\n"
+        "\n"
+        f"ENV = {pprint.pformat(values)}\n"
+    )
+
+    tmp_path = f"{target}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        f.write(content)
+    os.replace(tmp_path, target)
+    return target
+
+
+def load_compiled_env(path: str = ".env") -> Optional[Dict[str, Optional[str]]]:
+    """Load the values compiled from ``path``.
+
+    Returns:
+        The compiled mapping, or None if there is no compiled module or it is
+        older than ``path``.
+    """
+    target = compiled_path(path)
+    if not os.path.isfile(target):
+        return None
+
+    spec = importlib.util.spec_from_file_location("_compiled_env", target)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+
+    if os.path.isfile(path) and os.stat(path).st_mtime_ns != module.SOURCE_MTIME_NS:
+        return None
+    return dict(module.ENV)
+
+
+if __name__ == "__main__":
+    env_path = sys.argv[1] if len(sys.argv) > 1 else ".env"
+    print(f"Compiled {env_path} -> {compile_env(env_path)}")
@@ -0,0 +1,97 @@
+"""Redis cache connection and helpers.
+
+The cache is optional: if Redis is unreachable at startup, or a call fails
+later, helpers log a warning and behave as a cache miss so callers fall back
+to the database.
+"""
+
+import json
+import logging
+from typing import Any, Optional
+
+import redis.asyncio as aioredis
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Seconds a cached project statistics entry stays valid
+PROJECT_STATS_TTL_SECONDS = 30
+
+redis_client: Optional[aioredis.Redis] = None
+
+
+async def init_redis() -> None:
+    """Create the Redis client and verify the connection.
+
+    This function should be called once at application startup. On failure
+    the cache stays disabled instead of aborting startup.
+    """
+    global redis_client
+
+    client = aioredis.from_url(settings.REDIS_URL, decode_responses=True)
+    try:
+        await client.ping()
+    except Exception as e:
+        logger.warning(f"Redis unavailable, caching disabled: {str(e)}")
+        await client.aclose()
+        return
+
+    redis_client = client
+    logger.info("Redis cache initialized successfully")
+
+
+async def close_redis() -> None:
+    """Close the Redis client at application shutdown."""
+    global redis_client
+
+    if redis_client is not None:
+        try:
+            await redis_client.aclose()
+        except Exception as e:
+            logger.error(f"Error closing Redis connection: {str(e)}")
+        finally:
+            redis_client = None
+
+
+def get_redis() -> Optional[aioredis.Redis]:
+    """Return the Redis client, or None if caching is disabled."""
+    return redis_client
+
+
+def project_stats_key(project_id: int) -> str:
+    """Cache key for a project's task statistics."""
+    return f"stats:{project_id}"
+
+
+async def get_json(key: str) -> Optional[Any]:
+    """Return the decoded value cached under ``key``, or None on a miss."""
+    if redis_client is None:
+        return None
+    try:
+        value = await redis_client.get(key)
+    except Exception as e:
+        logger.warning(f"Redis GET {key} failed: {str(e)}")
+        return None
+    return json.loads(value) if value is not None else None
+
+
+async def set_json(key: str, value: Any, ttl_seconds: int) -> None:
+    """Cache ``value`` under ``key`` for ``ttl_seconds``."""
+    if redis_client is None:
+        return
+    try:
+        await redis_client.setex(key, ttl_seconds, json.dumps(value))
+    except Exception as e:
+        logger.warning(f"Redis SETEX {key} failed: {str(e)}")
+
+
+async def invalidate_project_stats(*project_ids: Optional[int]) -> None:
+    """Drop cached statistics for the given projects."""
+    keys = [project_stats_key(pid) for pid in project_ids if pid is not None]
+    if redis_client is None or not keys:
+        return
+    try:
+        await redis_client.delete(*keys)
+    except Exception as e:
+        logger.warning(f"Redis DEL {keys} failed: {str(e)}")
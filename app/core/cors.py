@@ -0,0 +1,32 @@
+"""CORS middleware with constant-time origin checks."""
+
+from typing import Sequence
+
+from starlette.middleware.cors import CORSMiddleware
+from starlette.types import ASGIApp
+
+
+def normalize_origin(origin: str) -> str:
+    """Normalize an origin for comparison: lowercase, no trailing slash."""
+    return origin.lower().rstrip("/")
+
+
+class FastCORSMiddleware(CORSMiddleware):
+    """CORSMiddleware that matches origins against a prebuilt frozenset.
+
+    Starlette keeps ``allow_origins`` as a list and scans it for every CORS
+    request; this checks a normalized set instead.
+    """
+
+    def __init__(self, app: ASGIApp, allow_origins: Sequence[str] = (), **kwargs) -> None:
+        super().__init__(app, allow_origins=allow_origins, **kwargs)
+        self._origin_set = frozenset(normalize_origin(origin) for origin in allow_origins)
+
+    def is_allowed_origin(self, origin: str) -> bool:
+        if self.allow_all_origins:
+            return True
+
+        if self.allow_origin_regex is not None and self.allow_origin_regex.fullmatch(origin):
+            return True
+
+        return normalize_origin(origin) in self._origin_set
@@ -1,7 +1,9 @@
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
 from sqlalchemy.orm import declarative_base
-from sqlalchemy.pool import NullPool, QueuePool
+from sqlalchemy.pool import AsyncAdaptedQueuePool, NullPool, QueuePool
 from typing import AsyncGenerator
+import asyncio
 import logging
 import os
 
@@ -34,12 +36,17 @@ def get_engine_config():
         config["poolclass"] = NullPool
     else:
         # Production connection pooling settings
-        config["poolclass"] = QueuePool
+        config["poolclass"] = AsyncAdaptedQueuePool
         config["pool_size"] = int(os.getenv("DB_POOL_SIZE", "10"))
         config["max_overflow"] = int(os.getenv("DB_MAX_OVERFLOW", "20"))
         config["pool_timeout"] = int(os.getenv("DB_POOL_TIMEOUT", "30"))
         config["pool_recycle"] = int(os.getenv("DB_POOL_RECYCLE", "3600"))
-        config["pool_pre_ping"] = True  # Verify connections before use
+        # Reuse the most recently returned connection so a small working set
+        # stays hot and idle extras age out via pool_recycle
+        config["pool_use_lifo"] = True
+        # Pre-ping costs a round-trip per checkout; stale connections are
+        # already bounded by pool_recycle, so it is opt-in
+        config["pool_pre_ping"] = os.getenv("DB_POOL_PRE_PING", "false").lower() == "true"
     
     return config
 
@@ -103,18 +110,89 @@ async def close_db() -> None:
             engine = None
 
 
-async def get_db() -> AsyncGenerator[AsyncSession, None]:
-    """Dependency function to get database session.
+async def db_warmup() -> None:
+    """Warm the connection pool and the engine's compiled statement cache.
+    
+    This function should be called after init_db() at application startup
+    so the first requests do not pay for opening pool connections or for
+    compiling the user lookup on the login path. The statement cache is
+    only filled on execution, so the lookup is run once through a session,
+    as the CRUD layer does. Failures are logged and do not abort startup.
+    """
+    if engine is None:
+        raise RuntimeError(
+            "Database not initialized. Call init_db() first."
+        )
+    
+    async def open_connection() -> None:
+        async with engine.connect() as conn:
+            await conn.execute(select(1))
+    
+    try:
+        # Open the whole pool concurrently so the first burst of requests
+        # does not pay for connection setup one by one
+        pool_size = engine.pool.size() if isinstance(engine.pool, QueuePool) else 1
+        await asyncio.gather(*(open_connection() for _ in range(pool_size)))
+        
+        # Imported here: the model modules import Base from this module
+        from app.models import User
+        
+        async with SessionLocal() as session:
+            await session.execute(select(User).where(User.email == "warmup"))
+        logger.info("Database warmup completed")
+    except Exception as e:
+        logger.warning(f"Database warmup failed: {str(e)}")
+
+
+async def get_db_rw() -> AsyncGenerator[AsyncSession, None]:
+    """Dependency function to get a read-write database session.
     
     This function should be used as a dependency in FastAPI routes
-    to get a database session that is automatically closed after use.
+    that modify data. The session is committed on success, rolled back
+    on error, and closed after use.
+    
+    Yields:
+        AsyncSession: An async database session
+        
+    Example:
+        @app.post("/items")
+        async def create_item(db: AsyncSession = Depends(get_db_rw)):
+            db.add(Item())
+    """
+    if SessionLocal is None:
+        raise RuntimeError(
+            "Database not initialized. Call init_db() at application startup."
+        )
+    
+    session = SessionLocal()
+    try:
+        yield session
+        await session.commit()
+    except Exception as e:
+        await session.rollback()
+        logger.error(f"Database session error: {str(e)}")
+        raise
+    finally:
+        await session.close()
+
+
+# Backwards-compatible name for the read-write dependency
+get_db = get_db_rw
+
+
+async def get_db_ro() -> AsyncGenerator[AsyncSession, None]:
+    """Dependency function to get a read-only database session.
+    
+    Use this for routes that only read. The transaction is opened as
+    READ ONLY and is never committed, saving the COMMIT round-trip;
+    closing the session ends it.
     
     Yields:
         AsyncSession: An async database session
         
     Example:
         @app.get("/items")
-        async def read_items(db: AsyncSession = Depends(get_db)):
+        async def read_items(db: AsyncSession = Depends(get_db_ro)):
             result = await db.execute(select(Item))
             return result.scalars().all()
     """
@@ -124,11 +202,14 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
         )
     
     session = SessionLocal()
+    session.info["readonly"] = True
     try:
+        # Applied when the connection is checked out, so the driver opens
+        # the transaction with BEGIN READ ONLY instead of a separate
+        # SET TRANSACTION statement.
+        await session.connection(execution_options={"postgresql_readonly": True})
         yield session
-        await session.commit()
     except Exception as e:
-        await session.rollback()
         logger.error(f"Database session error: {str(e)}")
         raise
     finally:
@@ -0,0 +1,33 @@
+"""Opaque cursors for keyset pagination.
+
+A cursor encodes the sort key of the last row of a page, ``(timestamp, id)``,
+so the next page can seek past it with an index lookup instead of skipping
+rows with OFFSET.
+"""
+
+import base64
+import json
+from datetime import datetime
+from typing import Tuple
+
+CursorKey = Tuple[datetime, int]
+
+
+def encode_cursor(key: CursorKey) -> str:
+    """Encode a ``(timestamp, id)`` sort key as a URL-safe cursor string."""
+    value, row_id = key
+    raw = json.dumps([value.isoformat(), row_id]).encode()
+    return base64.urlsafe_b64encode(raw).decode()
+
+
+def decode_cursor(cursor: str) -> CursorKey:
+    """Decode a cursor produced by encode_cursor.
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        value, row_id = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        return datetime.fromisoformat(value), int(row_id)
+    except (ValueError, TypeError) as e:
+        raise ValueError("Invalid pagination cursor") from e
@@ -0,0 +1,27 @@
+"""Responses for bodies serialized by pydantic-core.
+
+ORJSONResponse is the application default, but it still needs plain Python
+objects, so returning models means building a dict per row first. List
+endpoints can instead have a TypeAdapter validate ORM rows and dump JSON
+bytes in one call, then send those bytes as they are.
+"""
+
+from typing import Any, Iterable
+
+from pydantic import TypeAdapter
+from starlette.responses import Response
+
+
+class RawJSONResponse(Response):
+    """JSON response whose ``content`` is already-encoded bytes."""
+
+    media_type = "application/json"
+
+
+def adapter_response(adapter: TypeAdapter, rows: Iterable[Any], status_code: int = 200) -> RawJSONResponse:
+    """Validate ``rows`` with ``adapter`` and return them as a JSON response.
+
+    Example:
+        return adapter_response(TaskListAdapter, tasks)
+    """
+    return RawJSONResponse(adapter.dump_json(adapter.validate_python(rows)), status_code=status_code)
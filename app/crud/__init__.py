@@ -1,3 +1,3 @@
-from .user_crud import user_crud
-from .task_crud import task_crud
-from .project_crud import project_crud
+from .user import user_crud
+from .task import task_crud
+from .project import project_crud
@@ -1,7 +1,13 @@
 from typing import List, Optional
-from sqlalchemy.orm import Session
-from sqlalchemy import func
+from sqlalchemy import case, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.cache import (
+    PROJECT_STATS_TTL_SECONDS,
+    get_json,
+    project_stats_key,
+    set_json,
+)
 from app.crud.base import CRUDBase
 from app.models.project import Project
 from app.schemas.project import ProjectCreate, ProjectUpdate
@@ -13,8 +19,8 @@ class CRUDProject(CRUDBase[Project, ProjectCreate, ProjectUpdate]):
     owner-based queries and statistics.
     """
 
-    def create_with_owner(
-        self, db: Session, *, obj_in: ProjectCreate, owner_id: int
+    async def create_with_owner(
+        self, db: AsyncSession, *, obj_in: ProjectCreate, owner_id: int
     ) -> Project:
         """
         Create a new project with an owner.
@@ -27,16 +33,16 @@ class CRUDProject(CRUDBase[Project, ProjectCreate, ProjectUpdate]):
         Returns:
             Created project instance
         """
-        obj_in_data = obj_in.dict()
+        obj_in_data = obj_in.model_dump()
         db_obj = Project(**obj_in_data, owner_id=owner_id)
         db.add(db_obj)
-        db.commit()
-        db.refresh(db_obj)
+        await db.commit()
+        await db.refresh(db_obj)
         return db_obj
 
-    def get_multi_by_owner(
+    async def get_multi_by_owner(
         self,
-        db: Session,
+        db: AsyncSession,
         *,
         owner_id: int,
         skip: int = 0,
@@ -54,16 +60,16 @@ class CRUDProject(CRUDBase[Project, ProjectCreate, ProjectUpdate]):
         Returns:
             List of projects belonging to the owner
         """
-        return (
-            db.query(Project)
-            .filter(Project.owner_id == owner_id)
+        result = await db.execute(
+            select(Project)
+            .where(Project.owner_id == owner_id)
             .offset(skip)
             .limit(limit)
-            .all()
         )
+        return list(result.scalars().all())
 
-    def get_project_stats(
-        self, db: Session, *, project_id: int
+    async def get_project_stats(
+        self, db: AsyncSession, *, project_id: int
     ) -> dict:
         """
         Get statistics for a specific project.
@@ -79,21 +85,16 @@ class CRUDProject(CRUDBase[Project, ProjectCreate, ProjectUpdate]):
             - pending_tasks: Number of pending tasks
             - completion_rate: Percentage of completed tasks
         """
-        from app.models.task import Task
+        from app.models.task import Task, TaskStatus
         
-        # Get total tasks count
-        total_tasks = (
-            db.query(func.count(Task.id))
-            .filter(Task.project_id == project_id)
-            .scalar()
-        ) or 0
-        
-        # Get completed tasks count
-        completed_tasks = (
-            db.query(func.count(Task.id))
-            .filter(Task.project_id == project_id, Task.status == "completed")
-            .scalar()
-        ) or 0
+        # Count total and completed tasks in a single pass over the project's rows
+        result = await db.execute(
+            select(
+                func.count(Task.id),
+                func.count(case((Task.status == TaskStatus.COMPLETED, 1))),
+            ).where(Task.project_id == project_id)
+        )
+        total_tasks, completed_tasks = result.one()
         
         # Calculate pending tasks
         pending_tasks = total_tasks - completed_tasks
@@ -110,6 +111,29 @@ class CRUDProject(CRUDBase[Project, ProjectCreate, ProjectUpdate]):
             "completion_rate": round(completion_rate, 2),
         }
 
+    async def get_project_stats_cached(
+        self, db: AsyncSession, *, project_id: int
+    ) -> dict:
+        """
+        Get project statistics, served from Redis when available.
+        
+        Entries expire after PROJECT_STATS_TTL_SECONDS and are dropped
+        whenever one of the project's tasks is written.
+        
+        Args:
+            db: Database session
+            project_id: ID of the project
+            
+        Returns:
+            Same dictionary as get_project_stats
+        """
+        key = project_stats_key(project_id)
+        stats = await get_json(key)
+        if stats is None:
+            stats = await self.get_project_stats(db, project_id=project_id)
+            await set_json(key, stats, PROJECT_STATS_TTL_SECONDS)
+        return stats
+
 
 # Create instance of CRUDProject
 project_crud = CRUDProject(Project)
@@ -1,61 +1,122 @@
-from typing import List, Optional
-from sqlalchemy.orm import Session
 from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple, Union
+from sqlalchemy import func, select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
 
+from app.core.cache import invalidate_project_stats
 from app.crud.base import CRUDBase
-from app.models.task import Task
+from app.models.task import Task, TaskStatus
 from app.schemas.task import TaskCreate, TaskUpdate
 
 
 class CRUDTask(CRUDBase[Task, TaskCreate, TaskUpdate]):
-    def create_with_owner(
-        self, db: Session, *, obj_in: TaskCreate, owner_id: int
+    async def create(self, db: AsyncSession, *, obj_in: TaskCreate) -> Task:
+        """Create a task and drop the cached stats of its project."""
+        db_obj = await super().create(db, obj_in=obj_in)
+        await invalidate_project_stats(db_obj.project_id)
+        return db_obj
+
+    async def create_with_owner(
+        self, db: AsyncSession, *, obj_in: TaskCreate, owner_id: int
     ) -> Task:
         """Create a new task with an owner."""
-        obj_in_data = obj_in.dict()
-        db_obj = Task(**obj_in_data, owner_id=owner_id)
+        obj_in_data = obj_in.model_dump()
+        db_obj = Task(**obj_in_data, user_id=owner_id)
         db.add(db_obj)
-        db.commit()
-        db.refresh(db_obj)
+        await db.commit()
+        await db.refresh(db_obj)
+        await invalidate_project_stats(db_obj.project_id)
         return db_obj
 
-    def get_multi_by_owner(
-        self, db: Session, *, owner_id: int, skip: int = 0, limit: int = 100
-    ) -> List[Task]:
-        """Get multiple tasks by owner."""
-        return (
-            db.query(Task)
-            .filter(Task.owner_id == owner_id)
-            .offset(skip)
-            .limit(limit)
-            .all()
+    async def update(
+        self,
+        db: AsyncSession,
+        *,
+        db_obj: Task,
+        obj_in: Union[TaskUpdate, Dict[str, Any]]
+    ) -> Task:
+        """Update a task and drop the cached stats of affected projects."""
+        previous_project_id = db_obj.project_id
+        db_obj = await super().update(db, db_obj=db_obj, obj_in=obj_in)
+        await invalidate_project_stats(previous_project_id, db_obj.project_id)
+        return db_obj
+
+    async def remove(self, db: AsyncSession, *, id: Any) -> Optional[Task]:
+        """Delete a task and drop the cached stats of its project."""
+        obj = await super().remove(db, id=id)
+        if obj:
+            await invalidate_project_stats(obj.project_id)
+        return obj
+
+    async def get_multi_by_owner(
+        self,
+        db: AsyncSession,
+        *,
+        owner_id: int,
+        after: Optional[Tuple[datetime, int]] = None,
+        limit: int = 100,
+    ) -> Tuple[List[Task], Optional[Tuple[datetime, int]]]:
+        """Get a page of tasks by owner, oldest first.
+        
+        Pages are keyed on (created_at, id): pass the returned cursor as
+        ``after`` to fetch the next page. The cursor is None on the last page.
+        """
+        stmt = (
+            select(Task)
+            .options(selectinload(Task.project), selectinload(Task.tags))
+            .where(Task.user_id == owner_id)
         )
+        if after is not None:
+            stmt = stmt.where(tuple_(Task.created_at, Task.id) > tuple_(*after))
+        result = await db.execute(
+            stmt.order_by(Task.created_at, Task.id).limit(limit)
+        )
+        tasks = list(result.scalars().all())
+        next_cursor = (tasks[-1].created_at, tasks[-1].id) if len(tasks) == limit else None
+        return tasks, next_cursor
 
-    def get_by_project(
-        self, db: Session, *, project_id: int, skip: int = 0, limit: int = 100
+    async def get_by_project(
+        self, db: AsyncSession, *, project_id: int, skip: int = 0, limit: int = 100
     ) -> List[Task]:
         """Get tasks by project."""
-        return (
-            db.query(Task)
-            .filter(Task.project_id == project_id)
+        result = await db.execute(
+            select(Task)
+            .options(selectinload(Task.project), selectinload(Task.tags))
+            .where(Task.project_id == project_id)
             .offset(skip)
             .limit(limit)
-            .all()
         )
+        return list(result.scalars().all())
 
-    def get_overdue_tasks(
-        self, db: Session, *, skip: int = 0, limit: int = 100
-    ) -> List[Task]:
-        """Get all overdue tasks."""
-        current_time = datetime.utcnow()
-        return (
-            db.query(Task)
-            .filter(Task.due_date < current_time)
-            .filter(Task.status != "completed")
-            .offset(skip)
-            .limit(limit)
-            .all()
+    async def get_overdue_tasks(
+        self,
+        db: AsyncSession,
+        *,
+        after: Optional[Tuple[datetime, int]] = None,
+        limit: int = 100,
+    ) -> Tuple[List[Task], Optional[Tuple[datetime, int]]]:
+        """Get a page of overdue tasks, earliest deadline first.
+        
+        Pages are keyed on (deadline, id): pass the returned cursor as
+        ``after`` to fetch the next page. The cursor is None on the last page.
+        """
+        # Evaluate the cutoff server-side so the statement has no per-call
+        # parameter; deadlines are naive UTC, hence timezone('utc', now()).
+        stmt = (
+            select(Task)
+            .options(selectinload(Task.project), selectinload(Task.tags))
+            .where(Task.deadline < func.timezone("utc", func.now()))
+            .where(Task.status != TaskStatus.COMPLETED)
+        )
+        if after is not None:
+            stmt = stmt.where(tuple_(Task.deadline, Task.id) > tuple_(*after))
+        result = await db.execute(
+            stmt.order_by(Task.deadline, Task.id).limit(limit)
         )
+        tasks = list(result.scalars().all())
+        next_cursor = (tasks[-1].deadline, tasks[-1].id) if len(tasks) == limit else None
+        return tasks, next_cursor
 
 
 task_crud = CRUDTask(Task)
@@ -1,12 +1,14 @@
 from typing import Optional
-from sqlalchemy.orm import Session
-from passlib.context import CryptContext
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+import bcrypt
 
 from app.crud.base import CRUDBase
 from app.models.user import User
 from app.schemas.user import UserCreate, UserUpdate
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# Same cost factor passlib's bcrypt scheme used, so hashes stay interchangeable
+BCRYPT_ROUNDS = 12
 
 
 class CRUDUser(CRUDBase[User, UserCreate, UserUpdate]):
@@ -14,7 +16,7 @@ class CRUDUser(CRUDBase[User, UserCreate, UserUpdate]):
     CRUD operations for User model with authentication functionality.
     """
 
-    def get_by_email(self, db: Session, *, email: str) -> Optional[User]:
+    async def get_by_email(self, db: AsyncSession, *, email: str) -> Optional[User]:
         """
         Get user by email address.
         
@@ -25,9 +27,10 @@ class CRUDUser(CRUDBase[User, UserCreate, UserUpdate]):
         Returns:
             User object if found, None otherwise
         """
-        return db.query(User).filter(User.email == email).first()
+        result = await db.execute(select(User).where(User.email == email))
+        return result.scalars().first()
 
-    def get_by_username(self, db: Session, *, username: str) -> Optional[User]:
+    async def get_by_username(self, db: AsyncSession, *, username: str) -> Optional[User]:
         """
         Get user by username.
         
@@ -38,9 +41,10 @@ class CRUDUser(CRUDBase[User, UserCreate, UserUpdate]):
         Returns:
             User object if found, None otherwise
         """
-        return db.query(User).filter(User.username == username).first()
+        result = await db.execute(select(User).where(User.username == username))
+        return result.scalars().first()
 
-    def create(self, db: Session, *, obj_in: UserCreate) -> User:
+    async def create(self, db: AsyncSession, *, obj_in: UserCreate) -> User:
         """
         Create new user with hashed password.
         
@@ -60,11 +64,11 @@ class CRUDUser(CRUDBase[User, UserCreate, UserUpdate]):
             is_superuser=obj_in.is_superuser,
         )
         db.add(db_obj)
-        db.commit()
-        db.refresh(db_obj)
+        await db.commit()
+        await db.refresh(db_obj)
         return db_obj
 
-    def authenticate(self, db: Session, *, email: str, password: str) -> Optional[User]:
+    async def authenticate(self, db: AsyncSession, *, email: str, password: str) -> Optional[User]:
         """
         Authenticate user with email and password.
         
@@ -76,7 +80,7 @@ class CRUDUser(CRUDBase[User, UserCreate, UserUpdate]):
         Returns:
             User object if authentication successful, None otherwise
         """
-        user = self.get_by_email(db, email=email)
+        user = await self.get_by_email(db, email=email)
         if not user:
             return None
         if not self._verify_password(password, user.hashed_password):
@@ -117,7 +121,7 @@ class CRUDUser(CRUDBase[User, UserCreate, UserUpdate]):
         Returns:
             Hashed password
         """
-        return pwd_context.hash(password)
+        return bcrypt.hashpw(password.encode(), bcrypt.gensalt(rounds=BCRYPT_ROUNDS)).decode()
 
     def _verify_password(self, plain_password: str, hashed_password: str) -> bool:
         """
@@ -130,7 +134,7 @@ class CRUDUser(CRUDBase[User, UserCreate, UserUpdate]):
         Returns:
             True if password matches, False otherwise
         """
-        return pwd_context.verify(plain_password, hashed_password)
+        return bcrypt.checkpw(plain_password.encode(), hashed_password.encode())
 
 
 # Create user_crud instance
@@ -6,13 +6,16 @@ prioritization, natural language processing, and automated workflow orchestratio
 
 import asyncio
 import logging
-from fastapi import FastAPI, HTTPException, Depends
-from fastapi.middleware.cors import CORSMiddleware
+import bcrypt
+from fastapi import FastAPI, HTTPException, Depends, Request
+from fastapi.responses import ORJSONResponse
 from contextlib import asynccontextmanager
 
 from app.api.routes import tasks, projects, analytics, ai
-from app.core.config import settings
-from app.core.database import init_db, close_db
+from app.core.config import Settings, get_settings, settings
+from app.core.database import init_db, close_db, db_warmup
+from app.core.cache import init_redis, close_redis
+from app.core.cors import FastCORSMiddleware
 from app.services.ai_engine import AIEngine
 from app.services.task_scheduler import TaskScheduler
 
@@ -30,14 +33,21 @@ async def lifespan(app: FastAPI):
     # Startup
     logger.info("Starting AI Task Orchestrator...")
     await init_db()
+    await init_redis()
     
-    # Initialize AI Engine
+    # Warm lazy caches so the first request does not pay for them
+    await db_warmup()
+    bcrypt.hashpw(b"warmup", bcrypt.gensalt(rounds=4))
+    app.openapi()
+    
+    # Load AI models in the background; requests that need them wait on
+    # the shared load, everything else is served immediately
     app.state.ai_engine = AIEngine()
-    await app.state.ai_engine.initialize()
+    app.state.ai_engine.start_loading()
     
     # Initialize Task Scheduler
     app.state.scheduler = TaskScheduler(app.state.ai_engine)
-    await app.state.scheduler.start()
+    app.state.scheduler.start()
     
     logger.info("AI Task Orchestrator started successfully")
     
@@ -45,7 +55,9 @@ async def lifespan(app: FastAPI):
     
     # Shutdown
     logger.info("Shutting down AI Task Orchestrator...")
-    await app.state.scheduler.stop()
+    app.state.scheduler.shutdown()
+    await app.state.ai_engine.close()
+    await close_redis()
     await close_db()
     logger.info("AI Task Orchestrator shut down successfully")
 
@@ -55,12 +67,13 @@ app = FastAPI(
     title=settings.PROJECT_NAME,
     description=settings.PROJECT_DESCRIPTION,
     version=settings.VERSION,
+    default_response_class=ORJSONResponse,
     lifespan=lifespan
 )
 
 # Configure CORS
 app.add_middleware(
-    CORSMiddleware,
+    FastCORSMiddleware,
     allow_origins=settings.ALLOWED_ORIGINS,
     allow_credentials=True,
     allow_methods=["*"],
@@ -75,7 +88,7 @@ app.include_router(ai.router, prefix="/api/v1/ai", tags=["ai"])
 
 
 @app.get("/")
-async def root():
+async def root(settings: Settings = Depends(get_settings)):
     """Root endpoint"""
     return {
         "message": "Welcome to AI Task Orchestrator",
@@ -85,11 +98,11 @@ async def root():
 
 
 @app.get("/health")
-async def health_check():
+async def health_check(request: Request):
     """Health check endpoint"""
     return {
         "status": "healthy",
-        "ai_engine": "operational",
+        "ai_engine": request.app.state.ai_engine.status,
         "database": "connected"
     }
 
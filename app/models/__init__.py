@@ -1,7 +1,13 @@
+from app.core.database import Base
+
 from .user import User
 from .project import Project, ProjectStatus
 from .task import Task, TaskStatus, TaskPriority
 
+# Resolve string-based relationships for every mapper once, at import,
+# rather than on the first query.
+Base.registry.configure()
+
 __all__ = [
     "User",
     "Project",
@@ -2,9 +2,8 @@ from datetime import datetime
 from enum import Enum
 from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, Table, JSON
 from sqlalchemy.orm import relationship
-from sqlalchemy.ext.declarative import declarative_base
 
-Base = declarative_base()
+from app.core.database import Base
 
 class ProjectStatus(str, Enum):
     PLANNING = "planning"
@@ -39,7 +38,8 @@ class Project(Base):
     
     # Tags and metadata
     tags = Column(JSON, default=list)
-    metadata = Column(JSON, default=dict)
+    # 'metadata' is reserved by the declarative API; keep the column name
+    extra_metadata = Column('metadata', JSON, default=dict)
     
     # Timestamps
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
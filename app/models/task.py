@@ -1,9 +1,32 @@
 from datetime import datetime
-from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, Table
+from enum import Enum
+from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, Table, Index, text
+from sqlalchemy import Enum as SQLEnum
+from sqlalchemy import inspect
 from sqlalchemy.orm import relationship
-from sqlalchemy.ext.declarative import declarative_base
 
-Base = declarative_base()
+from app.core.database import Base
+
+
+class TaskStatus(str, Enum):
+    PENDING = "pending"
+    IN_PROGRESS = "in_progress"
+    COMPLETED = "completed"
+    FAILED = "failed"
+    CANCELLED = "cancelled"
+
+
+class TaskPriority(str, Enum):
+    LOW = "low"
+    MEDIUM = "medium"
+    HIGH = "high"
+    CRITICAL = "critical"
+
+
+def _enum_values(enum_cls):
+    """Persist enum values ('completed') rather than member names ('COMPLETED')."""
+    return [member.value for member in enum_cls]
+
 
 # Association table for many-to-many relationship between tasks and tags
 task_tags = Table(
@@ -21,8 +44,8 @@ class Task(Base):
         id: Primary key identifier
         title: Task title/name
         description: Detailed task description
-        status: Current status (e.g., 'pending', 'in_progress', 'completed', 'cancelled')
-        priority: Task priority level (e.g., 'low', 'medium', 'high', 'critical')
+        status: Current status, a TaskStatus value stored as the task_status enum type
+        priority: Task priority level, a TaskPriority value stored as the task_priority enum type
         deadline: Task deadline timestamp
         created_at: Timestamp when task was created
         updated_at: Timestamp when task was last updated
@@ -33,6 +56,14 @@ class Task(Base):
         project: Relationship to Project model
     """
     __tablename__ = 'tasks'
+    __table_args__ = (
+        # Overdue scan: open tasks in (deadline, id) keyset order
+        Index('ix_tasks_overdue', 'deadline', 'id', postgresql_where=text("status <> 'completed'")),
+        # Per-owner listings in (created_at, id) keyset order
+        Index('ix_tasks_owner_created', 'user_id', 'created_at', 'id'),
+        # Per-project status counts
+        Index('ix_tasks_project_status', 'project_id', 'status'),
+    )
     
     # Primary key
     id = Column(Integer, primary_key=True, index=True, autoincrement=True)
@@ -40,8 +71,16 @@ class Task(Base):
     # Core task information
     title = Column(String(255), nullable=False, index=True)
     description = Column(Text, nullable=True)
-    status = Column(String(50), nullable=False, default='pending', index=True)
-    priority = Column(String(50), nullable=False, default='medium', index=True)
+    status = Column(
+        SQLEnum(TaskStatus, name='task_status', values_callable=_enum_values),
+        nullable=False,
+        default=TaskStatus.PENDING,
+    )
+    priority = Column(
+        SQLEnum(TaskPriority, name='task_priority', values_callable=_enum_values),
+        nullable=False,
+        default=TaskPriority.MEDIUM,
+    )
     
     # Time-related fields
     deadline = Column(DateTime, nullable=True, index=True)
@@ -49,32 +88,48 @@ class Task(Base):
     updated_at = Column(DateTime, nullable=False, default=datetime.utcnow, onupdate=datetime.utcnow)
     
     # Foreign keys
-    user_id = Column(Integer, ForeignKey('users.id', ondelete='CASCADE'), nullable=False, index=True)
-    project_id = Column(Integer, ForeignKey('projects.id', ondelete='CASCADE'), nullable=True, index=True)
+    user_id = Column(Integer, ForeignKey('users.id', ondelete='CASCADE'), nullable=False)
+    project_id = Column(Integer, ForeignKey('projects.id', ondelete='CASCADE'), nullable=True)
     
     # Relationships
-    user = relationship('User', back_populates='tasks')
-    project = relationship('Project', back_populates='tasks')
-    tags = relationship('Tag', secondary=task_tags, back_populates='tasks')
+    # lazy='raise': callers must eager-load (see app.crud.task), so an
+    # accidental per-row lazy load fails loudly instead of issuing N queries
+    user = relationship('User', back_populates='tasks', lazy='raise')
+    project = relationship('Project', back_populates='tasks', lazy='raise')
+    tags = relationship('Tag', secondary=task_tags, back_populates='tasks', lazy='raise', passive_deletes=True)
     
     def __repr__(self):
         return f"<Task(id={self.id}, title='{self.title}', status='{self.status}', priority='{self.priority}')>"
     
-    def to_dict(self):
-        """Convert task instance to dictionary representation."""
+    def to_dict_scalar(self):
+        """Convert the task's column values to a dictionary.
+        
+        Never touches relationships, so it is safe on rows loaded without
+        eager options. Datetimes are returned as-is; the ORJSON response
+        class serializes them natively.
+        """
         return {
             'id': self.id,
             'title': self.title,
             'description': self.description,
             'status': self.status,
             'priority': self.priority,
-            'deadline': self.deadline.isoformat() if self.deadline else None,
-            'created_at': self.created_at.isoformat() if self.created_at else None,
-            'updated_at': self.updated_at.isoformat() if self.updated_at else None,
+            'deadline': self.deadline,
+            'created_at': self.created_at,
+            'updated_at': self.updated_at,
             'user_id': self.user_id,
             'project_id': self.project_id,
-            'tags': [tag.name for tag in self.tags] if self.tags else []
         }
+    
+    def to_dict_full(self):
+        """Convert the task, including tag names, to a dictionary.
+        
+        The caller must have loaded ``tags`` (e.g. with selectinload).
+        """
+        assert 'tags' not in inspect(self).unloaded, "Task.tags must be eager-loaded"
+        data = self.to_dict_scalar()
+        data['tags'] = [tag.name for tag in self.tags]
+        return data
 
 
 class Tag(Base):
@@ -18,5 +18,6 @@ class User(Base):
     created_at = Column(DateTime(timezone=True), server_default=func.now())
 
     # Relationships
-    projects = relationship("Project", back_populates="owner")
-    tasks = relationship("Task", back_populates="owner")
+    owned_projects = relationship("Project", foreign_keys="Project.owner_id", back_populates="owner")
+    projects = relationship("Project", secondary="project_members", back_populates="members")
+    tasks = relationship("Task", back_populates="user")
@@ -1,3 +1,7 @@
+from typing import List
+
+from pydantic import TypeAdapter
+
 from .task import (
     TaskBase,
     TaskCreate,
@@ -14,6 +18,13 @@ from .project import (
     ProjectWithStats,
 )
 
+# Built once at import so list endpoints can validate and serialize whole
+# result sets in a single pydantic-core call. ORM rows must be validated
+# before dumping; app.core.responses.adapter_response does both, e.g.
+# adapter_response(TaskListAdapter, rows)
+TaskListAdapter = TypeAdapter(List[TaskResponse])
+ProjectStatsListAdapter = TypeAdapter(List[ProjectWithStats])
+
 __all__ = [
     # Task schemas
     "TaskBase",
@@ -27,4 +38,7 @@ __all__ = [
     "ProjectUpdate",
     "ProjectResponse",
     "ProjectWithStats",
+    # List adapters
+    "TaskListAdapter",
+    "ProjectStatsListAdapter",
 ]
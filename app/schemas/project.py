@@ -1,6 +1,6 @@
 from datetime import datetime
 from typing import Optional
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class ProjectBase(BaseModel):
@@ -24,13 +24,12 @@ class ProjectUpdate(BaseModel):
 
 class ProjectResponse(ProjectBase):
     """Schema for Project response."""
+    model_config = ConfigDict(from_attributes=True)
+
     id: int = Field(..., description="Project ID")
     created_at: datetime = Field(..., description="Creation timestamp")
     updated_at: datetime = Field(..., description="Last update timestamp")
 
-    class Config:
-        from_attributes = True
-
 
 class ProjectWithStats(ProjectResponse):
     """Schema for Project response with statistics."""
@@ -38,6 +37,3 @@ class ProjectWithStats(ProjectResponse):
     completed_tasks: int = Field(default=0, description="Number of completed tasks")
     pending_tasks: int = Field(default=0, description="Number of pending tasks")
     in_progress_tasks: int = Field(default=0, description="Number of in-progress tasks")
-
-    class Config:
-        from_attributes = True
@@ -5,19 +5,49 @@ natural language processing, and workflow automation.
 """
 
 import asyncio
+import json
 import logging
-from typing import List, Dict, Optional, Any
+import random
+import re
+import time
+from typing import List, Dict, Optional, Any, Tuple, Union
 from datetime import datetime
 
 import openai
-from transformers import pipeline
+from openai import AsyncOpenAI
+import torch
+from transformers import AutoModelForSequenceClassification, AutoTokenizer
 from sentence_transformers import SentenceTransformer
 import numpy as np
 
 from app.core.config import settings
+from app.services._fastpath import deadline_timestamp, priority_score
+from app.services.batcher import MicroBatcher
+from app.services.embedding_cache import EmbeddingCache, LRUCache, text_key
+from app.services.rate_limiter import AsyncTokenBucket
 
 logger = logging.getLogger(__name__)
 
+# A bulleted ("- ", "* ") or numbered ("1.", "2)") line; group 1 is the item
+# text. Bullets need trailing whitespace and numbers must not be decimals,
+# so "**Bold:**", "*emphasis*" and "1.5 hours" are not items; text made only
+# of bullet characters (empty bullets, rules like "- - -") is skipped.
+_SUBTASK_RE = re.compile(
+    r'^[ \t]*(?:[-*][ \t]+|\d+[.)](?!\d)[ \t]*)(?![-* \t]*\r?$)(\S(?:.*\S)?)[ \t\r]*$',
+    re.MULTILINE
+)
+
+# Failures worth retrying with backoff; the client's own retries are off so
+# every attempt passes through the shared rate budgets
+_RETRYABLE_ERRORS = (
+    openai.RateLimitError,
+    openai.APIConnectionError,  # includes APITimeoutError
+    openai.InternalServerError
+)
+
+# Urgency classes, matched against task text by embedding similarity
+_URGENCY_LABELS = ["urgent", "high priority", "medium priority", "low priority"]
+
 
 class AIEngine:
     """Advanced AI engine for task orchestration"""
@@ -25,40 +55,126 @@ class AIEngine:
     def __init__(self):
         self.client = None
         self.embedding_model = None
-        self.sentiment_analyzer = None
-        self.text_classifier = None
+        self.sentiment_tokenizer = None
+        self.sentiment_model = None
+        self.device = "cpu"
         self.initialized = False
+        self.load_error: Optional[Exception] = None
+        self._init_task: Optional[asyncio.Task] = None
+        
+        # Normalized embeddings of _URGENCY_LABELS, computed in initialize
+        self._urgency_labels = list(_URGENCY_LABELS)
+        self._label_embs: Optional[np.ndarray] = None
         
+        # Model outputs memoized by text hash
+        self._embedding_cache = EmbeddingCache(
+            maxsize=settings.EMBEDDING_CACHE_SIZE,
+            path=settings.EMBEDDING_CACHE_PATH or None
+        )
+        self._analysis_cache = LRUCache(maxsize=settings.EMBEDDING_CACHE_SIZE)
+        
+        # Concurrent analyze_task_priority misses share one forward pass
+        self._analysis_batcher = MicroBatcher(self._analyze_texts, max_batch=32, max_wait_ms=10)
+        
+        # Outbound OpenAI throttling: bounded concurrency plus proactive
+        # requests/tokens per minute budgets
+        self._openai_semaphore = asyncio.Semaphore(settings.OPENAI_MAX_CONCURRENT)
+        self._rpm_bucket = AsyncTokenBucket(settings.OPENAI_RPM_LIMIT)
+        self._tpm_bucket = AsyncTokenBucket(settings.OPENAI_TPM_LIMIT)
+        
+    @property
+    def status(self) -> str:
+        """Load state reported by the health check"""
+        if self.initialized:
+            return "operational"
+        return "failed" if self.load_error is not None else "loading"
+    
+    def start_loading(self) -> asyncio.Task:
+        """Start loading models in the background and return the load task
+        
+        Safe to call repeatedly: concurrent callers share one load. A failed
+        load is not retried; its error is kept in ``load_error``.
+        """
+        task = self._init_task
+        if task is None or task.cancelled():
+            self._init_task = asyncio.create_task(self._load_models())
+        return self._init_task
+    
     async def initialize(self):
-        """Initialize AI models"""
+        """Wait until the AI models are loaded, starting the load if needed
+        
+        Raises:
+            Exception: The error of a failed load, without loading again
+        """
+        if self.load_error is None:
+            # Shielded so a cancelled caller does not abort the shared load
+            await asyncio.shield(self.start_loading())
+        if self.load_error is not None:
+            raise self.load_error
+    
+    async def _load_models(self):
+        """Load all AI models, overlapping the independent loads in threads"""
         try:
             logger.info("Initializing AI Engine...")
             
-            # Initialize OpenAI client
-            openai.api_key = settings.OPENAI_API_KEY
-            self.client = openai
+            # Initialize OpenAI client; retries are handled in _chat_completion
+            # so they respect the shared budgets
+            self.client = AsyncOpenAI(api_key=settings.OPENAI_API_KEY, max_retries=0)
             
-            # Load embedding model for semantic search
-            self.embedding_model = SentenceTransformer('all-MiniLM-L6-v2')
+            device, dtype = self._inference_device()
+            self.device = device
+            if settings.INFERENCE_NUM_THREADS:
+                torch.set_num_threads(settings.INFERENCE_NUM_THREADS)
             
-            # Load sentiment analysis pipeline
-            self.sentiment_analyzer = pipeline(
-                "sentiment-analysis",
-                model="distilbert-base-uncased-finetuned-sst-2-english"
+            # Downloads and weight initialization mostly run outside the GIL
+            await asyncio.gather(
+                asyncio.to_thread(self._load_embedding_model, device, dtype),
+                asyncio.to_thread(self._load_sentiment_model, device, dtype)
             )
             
-            # Load zero-shot classification model
-            self.text_classifier = pipeline(
-                "zero-shot-classification",
-                model="facebook/bart-large-mnli"
-            )
+            # Urgency is classified by cosine similarity to these label
+            # embeddings instead of a zero-shot NLI model
+            self._label_embs = await asyncio.to_thread(self._embed, self._urgency_labels)
             
             self.initialized = True
             logger.info("AI Engine initialized successfully")
             
         except Exception as e:
+            # Kept rather than raised so the background task never ends
+            # with an unretrieved exception; initialize re-raises it
             logger.error(f"Failed to initialize AI Engine: {e}")
-            raise
+            self.load_error = e
+    
+    def _load_embedding_model(self, device: str, dtype: torch.dtype):
+        """Load embedding model for semantic search"""
+        model = SentenceTransformer('all-MiniLM-L6-v2', device=device)
+        if settings.EMBEDDING_BACKEND == "onnx":
+            from app.services.onnx_encoder import OnnxSentenceEncoder
+            
+            model = OnnxSentenceEncoder(
+                model,
+                settings.EMBEDDING_ONNX_PATH,
+                num_threads=settings.INFERENCE_NUM_THREADS or None
+            )
+        else:
+            model[0].auto_model.to(dtype=dtype)
+        self.embedding_model = model
+    
+    def _load_sentiment_model(self, device: str, dtype: torch.dtype):
+        """Load sentiment model; called directly rather than through a
+        pipeline to avoid its per-call preprocessing overhead"""
+        sentiment_name = "distilbert-base-uncased-finetuned-sst-2-english"
+        self.sentiment_tokenizer = AutoTokenizer.from_pretrained(sentiment_name)
+        self.sentiment_model = AutoModelForSequenceClassification.from_pretrained(
+            sentiment_name, torch_dtype=dtype
+        ).to(device).eval()
+    
+    async def close(self):
+        """Stop background batching and release the embedding store"""
+        if self._init_task is not None and not self._init_task.done():
+            self._init_task.cancel()
+        await self._analysis_batcher.close()
+        self._embedding_cache.close()
     
     async def analyze_task_priority(self, task: Dict[str, Any]) -> Dict[str, Any]:
         """Analyze and determine task priority using AI"""
@@ -71,14 +187,14 @@ class AIEngine:
             deadline = task.get("deadline")
             
             # Combine text for analysis
-            text = f"{title}. {description}"
+            text = f"{title}. {description}"[:512]
             
-            # Perform sentiment analysis
-            sentiment = self.sentiment_analyzer(text[:512])[0]
-            
-            # Classify urgency
-            urgency_labels = ["urgent", "high priority", "medium priority", "low priority"]
-            urgency_result = self.text_classifier(text[:512], urgency_labels)
+            # Model outputs depend only on the text, so reuse earlier runs
+            key = text_key(text)
+            cached = self._analysis_cache.get(key)
+            if cached is None:
+                cached = await self._analysis_batcher.submit(text)
+            sentiment, urgency_result = cached
             
             # Calculate priority score
             priority_score = self._calculate_priority_score(
@@ -99,6 +215,32 @@ class AIEngine:
             logger.error(f"Error analyzing task priority: {e}")
             return {"priority_score": 50, "error": str(e)}
     
+    async def _analyze_texts(self, texts: List[str]) -> List[Tuple[Dict[str, Any], Dict[str, Any]]]:
+        """Run sentiment and urgency classification for a batch of texts
+        
+        Returns one ``(sentiment, urgency_result)`` pair per text and caches it.
+        """
+        # Sentiment and embedding are independent forward passes, so run
+        # them side by side off the event loop
+        sentiments, embeddings = await asyncio.gather(
+            asyncio.to_thread(self._sentiment, texts),
+            asyncio.to_thread(self._embed, texts)
+        )
+        
+        # Classify urgency, best match first
+        scores = embeddings @ self._label_embs.T
+        order = np.argsort(-scores, axis=1)
+        
+        results = []
+        for text, sentiment, row, row_order in zip(texts, sentiments, scores, order):
+            urgency_result = {
+                "labels": [self._urgency_labels[i] for i in row_order],
+                "scores": row[row_order].tolist()
+            }
+            self._analysis_cache.put(text_key(text), (sentiment, urgency_result))
+            results.append((sentiment, urgency_result))
+        return results
+    
     async def generate_subtasks(self, task: Dict[str, Any]) -> List[Dict[str, str]]:
         """Generate subtasks using GPT"""
         if not self.initialized:
@@ -114,7 +256,7 @@ class AIEngine:
             Generate 3-5 specific, actionable subtasks.
             """
             
-            response = await self.client.ChatCompletion.acreate(
+            response = await self._chat_completion(
                 model="gpt-3.5-turbo",
                 messages=[
                     {"role": "system", "content": "You are a helpful task management assistant."},
@@ -132,66 +274,190 @@ class AIEngine:
             logger.error(f"Error generating subtasks: {e}")
             return []
     
+    async def generate_subtasks_batch(
+        self, tasks: List[Dict[str, Any]], batch_size: int = 10
+    ) -> List[List[Dict[str, str]]]:
+        """Generate subtasks for many tasks, packing up to ``batch_size`` tasks per request
+        
+        Returns one subtask list per input task, in input order.
+        """
+        if not self.initialized:
+            await self.initialize()
+        
+        chunks = [tasks[i:i + batch_size] for i in range(0, len(tasks), batch_size)]
+        results = await asyncio.gather(*(self._generate_subtasks_chunk(chunk) for chunk in chunks))
+        return [subtasks for chunk_result in results for subtasks in chunk_result]
+    
+    async def _generate_subtasks_chunk(self, tasks: List[Dict[str, Any]]) -> List[List[Dict[str, str]]]:
+        """Generate subtasks for ``tasks`` with a single JSON-mode completion"""
+        try:
+            listing = "\n".join(
+                f"{number}. Task: {task.get('title')}\n   Description: {task.get('description', 'N/A')}"
+                for number, task in enumerate(tasks, start=1)
+            )
+            prompt = (
+                "Break down each of these tasks into 3-5 specific, actionable subtasks:\n\n"
+                f"{listing}\n\n"
+                'Respond with JSON of the form '
+                '{"results": [{"task": <task number>, "subtasks": ["...", "..."]}]}'
+            )
+            
+            response = await self._chat_completion(
+                model="gpt-3.5-turbo",
+                messages=[
+                    {"role": "system", "content": "You are a helpful task management assistant."},
+                    {"role": "user", "content": prompt}
+                ],
+                max_tokens=300 * len(tasks),
+                response_format={"type": "json_object"}
+            )
+            
+            payload = json.loads(response.choices[0].message.content)
+            subtasks_by_number = {}
+            for entry in payload.get("results", []):
+                titles = (str(title).strip() for title in entry.get("subtasks", []))
+                subtasks_by_number[int(entry["task"])] = [
+                    {"title": title, "status": "pending"} for title in titles if title
+                ]
+            
+            return [subtasks_by_number.get(number, []) for number in range(1, len(tasks) + 1)]
+            
+        except Exception as e:
+            logger.error(f"Error generating subtasks batch: {e}")
+            return [[] for _ in tasks]
+    
+    async def gather_subtasks(self, tasks: List[Dict[str, Any]]) -> List[List[Dict[str, str]]]:
+        """Generate subtasks for several tasks concurrently, within the rate limits"""
+        return await asyncio.gather(*(self.generate_subtasks(task) for task in tasks))
+    
+    async def _chat_completion(self, *, messages: List[Dict[str, str]], max_tokens: int, **kwargs):
+        """Create a chat completion within the concurrency and rate budgets.
+        
+        Rate limits, connection failures, timeouts and 5xx responses are
+        retried with jittered exponential backoff.
+        """
+        # Rough prompt size (~4 characters per token) plus the completion budget
+        estimated_tokens = sum(len(m["content"]) for m in messages) // 4 + max_tokens
+        
+        for attempt in range(settings.OPENAI_MAX_RETRIES + 1):
+            async with self._openai_semaphore:
+                await self._rpm_bucket.acquire(1)
+                await self._tpm_bucket.acquire(estimated_tokens)
+                try:
+                    return await self.client.chat.completions.create(
+                        messages=messages,
+                        max_tokens=max_tokens,
+                        **kwargs
+                    )
+                except _RETRYABLE_ERRORS as e:
+                    if attempt == settings.OPENAI_MAX_RETRIES:
+                        raise
+                    error = e
+            
+            # Back off outside the semaphore so other calls can proceed
+            delay = min(60.0, 2 ** attempt) * random.uniform(0.5, 1.5)
+            logger.warning(f"OpenAI request failed ({type(error).__name__}), retrying in {delay:.1f}s")
+            await asyncio.sleep(delay)
+    
     async def find_similar_tasks(self, task: Dict[str, Any], all_tasks: List[Dict]) -> List[Dict]:
         """Find similar tasks using semantic search"""
         if not self.initialized:
             await self.initialize()
         
         try:
-            # Create embedding for current task
-            task_text = f"{task.get('title')} {task.get('description', '')}"
-            task_embedding = self.embedding_model.encode(task_text)
-            
-            # Calculate similarity with all tasks
-            similarities = []
-            for other_task in all_tasks:
-                if other_task.get('id') == task.get('id'):
-                    continue
-                
-                other_text = f"{other_task.get('title')} {other_task.get('description', '')}"
-                other_embedding = self.embedding_model.encode(other_text)
-                
-                similarity = np.dot(task_embedding, other_embedding) / (
-                    np.linalg.norm(task_embedding) * np.linalg.norm(other_embedding)
-                )
-                
-                similarities.append({
-                    "task": other_task,
-                    "similarity": float(similarity)
-                })
+            candidates = [t for t in all_tasks if t.get('id') != task.get('id')]
+            if not candidates:
+                return []
+            
+            texts = [f"{task.get('title')} {task.get('description', '')}"]
+            texts.extend(f"{t.get('title')} {t.get('description', '')}" for t in candidates)
+            embeddings = await asyncio.to_thread(self._embed, texts)
+            similarities = embeddings[1:] @ embeddings[0]
             
-            # Sort by similarity and return top 5
-            similarities.sort(key=lambda x: x["similarity"], reverse=True)
-            return similarities[:5]
+            # Select the top 5 without sorting every candidate
+            top_k = min(5, len(candidates))
+            top = np.argpartition(-similarities, top_k - 1)[:top_k]
+            top = top[np.argsort(-similarities[top])]
+            
+            return [
+                {"task": candidates[i], "similarity": float(similarities[i])}
+                for i in top
+            ]
             
         except Exception as e:
             logger.error(f"Error finding similar tasks: {e}")
             return []
     
-    def _calculate_priority_score(self, sentiment: Dict, urgency: Dict, deadline: Optional[str]) -> float:
-        """Calculate numerical priority score"""
-        # Base score from urgency classification
-        urgency_scores = {
-            "urgent": 90,
-            "high priority": 70,
-            "medium priority": 50,
-            "low priority": 30
-        }
+    @staticmethod
+    def _inference_device() -> Tuple[str, torch.dtype]:
+        """Pick the device and weight dtype for the local models.
         
-        score = urgency_scores.get(urgency["labels"][0], 50)
+        On GPU the weights run in half precision, halving memory traffic per
+        forward pass: bfloat16 where supported (Ampere and newer), float16
+        otherwise. CPUs keep float32.
+        """
+        if torch.cuda.is_available():
+            dtype = torch.bfloat16 if torch.cuda.is_bf16_supported() else torch.float16
+            return "cuda", dtype
+        return "cpu", torch.float32
+    
+    def _sentiment(self, texts: List[str]) -> List[Dict[str, Any]]:
+        """Classify each text as POSITIVE or NEGATIVE with a single forward pass"""
+        inputs = self.sentiment_tokenizer(
+            texts, padding=True, truncation=True, max_length=512, return_tensors="pt"
+        ).to(self.device)
+        with torch.inference_mode():
+            logits = self.sentiment_model(**inputs).logits
+        scores, label_ids = logits.float().softmax(dim=-1).max(dim=-1)
+        id2label = self.sentiment_model.config.id2label
+        return [
+            {"label": id2label[label_id], "score": score}
+            for label_id, score in zip(label_ids.tolist(), scores.tolist())
+        ]
+    
+    def _embed(self, texts: List[str]) -> np.ndarray:
+        """Return normalized embeddings for ``texts``, encoding only cache misses.
         
-        # Adjust based on sentiment (negative sentiment increases urgency)
-        if sentiment["label"] == "NEGATIVE":
-            score += 10
+        Misses are encoded in one batched call; normalized embeddings make
+        cosine similarity a dot product.
+        """
+        keys = [text_key(text) for text in texts]
+        vectors = self._embedding_cache.get_many(keys)
         
-        # Adjust based on deadline
-        if deadline:
-            # Add deadline logic here
-            pass
+        misses = [i for i, vec in enumerate(vectors) if vec is None]
+        if misses:
+            with torch.inference_mode():
+                encoded = self.embedding_model.encode(
+                    [texts[i] for i in misses],
+                    batch_size=64,
+                    convert_to_tensor=True,
+                    show_progress_bar=False
+                )
+                # Upcast so the norm is computed in float32 even when the
+                # model runs in half precision
+                encoded = np.ascontiguousarray(encoded.float().cpu().numpy(), dtype=np.float32)
+            # Normalize in place; all-zero rows stay zero instead of turning into NaN
+            norms = np.linalg.norm(encoded, axis=1, keepdims=True)
+            encoded /= np.maximum(norms, 1e-12)
+            self._embedding_cache.put_many([keys[i] for i in misses], encoded)
+            for i, vec in zip(misses, encoded):
+                vectors[i] = vec
         
-        return min(100, max(0, score))
+        # One C-contiguous float32 matrix so similarity is a single BLAS matmul
+        return np.ascontiguousarray(np.stack(vectors), dtype=np.float32)
+    
+    def _calculate_priority_score(
+        self, sentiment: Dict, urgency: Dict, deadline: Optional[Union[str, datetime]]
+    ) -> int:
+        """Calculate numerical priority score"""
+        return priority_score(
+            urgency["labels"][0],
+            sentiment["label"] == "NEGATIVE",
+            deadline_timestamp(deadline),
+            time.time()
+        )
     
-    def _recommend_deadline(self, priority_score: float) -> str:
+    def _recommend_deadline(self, priority_score: int) -> str:
         """Recommend deadline based on priority"""
         if priority_score >= 80:
             return "within 24 hours"
@@ -204,18 +470,7 @@ class AIEngine:
     
     def _parse_subtasks(self, text: str) -> List[Dict[str, str]]:
         """Parse subtasks from GPT response"""
-        lines = text.strip().split('\n')
-        subtasks = []
-        
-        for line in lines:
-            line = line.strip()
-            if line and (line[0].isdigit() or line.startswith('-')):
-                # Remove numbering or bullets
-                task_text = line.lstrip('0123456789.-) ')
-                if task_text:
-                    subtasks.append({
-                        "title": task_text,
-                        "status": "pending"
-                    })
-        
-        return subtasks
+        return [
+            {"title": match.group(1), "status": "pending"}
+            for match in _SUBTASK_RE.finditer(text)
+        ]
@@ -0,0 +1,93 @@
+"""Micro-batching for concurrent single-item model calls."""
+
+import asyncio
+import logging
+from typing import Awaitable, Callable, Generic, List, Optional, Tuple, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+class MicroBatcher(Generic[T, R]):
+    """Coalesce concurrent ``submit`` calls into batched ``process_batch`` calls.
+
+    A background worker takes the first queued item, then keeps collecting
+    until ``max_batch`` items are pending or ``max_wait_ms`` has passed, and
+    hands the whole batch to ``process_batch``. It must return one result per
+    item, in order. If it raises, every caller in that batch gets the error.
+    """
+
+    def __init__(
+        self,
+        process_batch: Callable[[List[T]], Awaitable[List[R]]],
+        max_batch: int = 32,
+        max_wait_ms: float = 10.0
+    ) -> None:
+        if max_batch < 1:
+            raise ValueError("max_batch must be at least 1")
+        self.process_batch = process_batch
+        self.max_batch = max_batch
+        self.max_wait = max_wait_ms / 1000
+        self._queue: "asyncio.Queue[Tuple[T, asyncio.Future]]" = asyncio.Queue()
+        self._worker: Optional[asyncio.Task] = None
+
+    async def submit(self, item: T) -> R:
+        """Queue ``item`` and wait for its result."""
+        if self._worker is None or self._worker.done():
+            self._worker = asyncio.create_task(self._run())
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((item, future))
+        return await future
+
+    async def close(self) -> None:
+        """Stop the worker; requests still queued are cancelled."""
+        if self._worker is not None:
+            self._worker.cancel()
+            try:
+                await self._worker
+            except asyncio.CancelledError:
+                pass
+            self._worker = None
+        while not self._queue.empty():
+            _, future = self._queue.get_nowait()
+            future.cancel()
+
+    async def _run(self) -> None:
+        while True:
+            batch: List[Tuple[T, asyncio.Future]] = []
+            try:
+                await self._fill(batch)
+                items = [item for item, _ in batch]
+                results = await self.process_batch(items)
+            except asyncio.CancelledError:
+                # These were already dequeued, so close() cannot reach them
+                for _, future in batch:
+                    future.cancel()
+                raise
+            except Exception as e:
+                logger.error(f"Batch of {len(batch)} failed: {e}")
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+
+            for (_, future), result in zip(batch, results):
+                # The caller may have been cancelled while waiting
+                if not future.done():
+                    future.set_result(result)
+
+    async def _fill(self, batch: List[Tuple[T, asyncio.Future]]) -> None:
+        """Wait for one item, then collect more until the batch is full or the wait expires."""
+        loop = asyncio.get_running_loop()
+        batch.append(await self._queue.get())
+        deadline = loop.time() + self.max_wait
+        while len(batch) < self.max_batch:
+            timeout = deadline - loop.time()
+            if timeout <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+            except asyncio.TimeoutError:
+                break
@@ -0,0 +1,110 @@
+"""Text-keyed caches for model outputs.
+
+Keys are BLAKE2b digests of whitespace-normalized text. Entries live in an
+in-memory LRU and, for embeddings, optionally in a SQLite file so they
+survive restarts.
+"""
+
+import hashlib
+import logging
+import sqlite3
+import threading
+from collections import OrderedDict
+from typing import Any, Hashable, List, Optional, Sequence
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+def text_key(text: str) -> bytes:
+    """Return the cache key for ``text``."""
+    normalized = " ".join(text.split())
+    return hashlib.blake2b(normalized.encode("utf-8"), digest_size=16).digest()
+
+
+class LRUCache:
+    """Thread-safe mapping that evicts the least recently used entry."""
+
+    def __init__(self, maxsize: int) -> None:
+        self.maxsize = maxsize
+        self._data: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        with self._lock:
+            value = self._data.get(key)
+            if value is not None:
+                self._data.move_to_end(key)
+            return value
+
+    def put(self, key: Hashable, value: Any) -> None:
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class EmbeddingCache:
+    """LRU cache of embedding vectors with an optional SQLite backing store."""
+
+    def __init__(self, maxsize: int = 100_000, path: Optional[str] = None) -> None:
+        self._memory = LRUCache(maxsize)
+        self._db: Optional[sqlite3.Connection] = None
+        self._db_lock = threading.Lock()
+        if path:
+            self._db = sqlite3.connect(path, check_same_thread=False)
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS embeddings (key BLOB PRIMARY KEY, vector BLOB NOT NULL)"
+            )
+            self._db.commit()
+
+    def get_many(self, keys: Sequence[bytes]) -> List[Optional[np.ndarray]]:
+        """Return the cached vector for each key, or None where missing."""
+        vectors = [self._memory.get(key) for key in keys]
+        missing = [key for key, vec in zip(keys, vectors) if vec is None]
+        if self._db is None or not missing:
+            return vectors
+
+        stored = {}
+        with self._db_lock:
+            for start in range(0, len(missing), 500):
+                chunk = missing[start:start + 500]
+                placeholders = ",".join("?" * len(chunk))
+                rows = self._db.execute(
+                    f"SELECT key, vector FROM embeddings WHERE key IN ({placeholders})", chunk
+                ).fetchall()
+                stored.update(rows)
+
+        for i, key in enumerate(keys):
+            if vectors[i] is None and key in stored:
+                vec = np.frombuffer(stored[key], dtype=np.float32)
+                self._memory.put(key, vec)
+                vectors[i] = vec
+        return vectors
+
+    def put_many(self, keys: Sequence[bytes], vectors: np.ndarray) -> None:
+        """Cache one vector per key."""
+        vectors = np.asarray(vectors, dtype=np.float32)
+        for key, vec in zip(keys, vectors):
+            self._memory.put(key, vec)
+        if self._db is None:
+            return
+        try:
+            with self._db_lock:
+                self._db.executemany(
+                    "INSERT OR REPLACE INTO embeddings (key, vector) VALUES (?, ?)",
+                    [(key, vec.tobytes()) for key, vec in zip(keys, vectors)],
+                )
+                self._db.commit()
+        except sqlite3.Error as e:
+            logger.warning(f"Failed to persist embeddings: {e}")
+
+    def close(self) -> None:
+        if self._db is not None:
+            self._db.close()
+            self._db = None
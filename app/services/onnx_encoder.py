@@ -0,0 +1,110 @@
+"""ONNX Runtime backend for the sentence embedding model.
+
+The transformer behind a SentenceTransformer is exported once to an ONNX
+file and then served by ONNX Runtime, which avoids PyTorch's per-op Python
+dispatch. Mean pooling matches the pooling layer of all-MiniLM-L6-v2.
+"""
+
+import copy
+import logging
+import os
+from typing import List, Optional
+
+import numpy as np
+import torch
+from sentence_transformers import SentenceTransformer
+
+logger = logging.getLogger(__name__)
+
+
+class OnnxSentenceEncoder:
+    """Replacement for ``SentenceTransformer.encode`` backed by ONNX Runtime."""
+
+    def __init__(
+        self,
+        model: SentenceTransformer,
+        model_path: str,
+        num_threads: Optional[int] = None
+    ) -> None:
+        import onnxruntime as ort
+
+        self.tokenizer = model.tokenizer
+        self.max_seq_length = model.max_seq_length
+
+        if not os.path.exists(model_path):
+            self._export(model[0].auto_model, model_path)
+
+        options = ort.SessionOptions()
+        if num_threads:
+            options.intra_op_num_threads = num_threads
+        available = ort.get_available_providers()
+        providers = [
+            p for p in ("CUDAExecutionProvider", "CPUExecutionProvider") if p in available
+        ]
+        self.session = ort.InferenceSession(model_path, sess_options=options, providers=providers)
+        logger.info(f"Serving embeddings from {model_path} via {self.session.get_providers()[0]}")
+
+    def _export(self, auto_model: torch.nn.Module, model_path: str) -> None:
+        """Export the transformer to ONNX with dynamic batch and sequence axes."""
+        logger.info(f"Exporting embedding model to {model_path}")
+        os.makedirs(os.path.dirname(model_path) or ".", exist_ok=True)
+
+        export_model = copy.deepcopy(auto_model).float().cpu().eval()
+        dummy = self.tokenizer(["export"], return_tensors="pt")
+        dynamic_axes = {
+            "input_ids": {0: "batch", 1: "sequence"},
+            "attention_mask": {0: "batch", 1: "sequence"},
+            "last_hidden_state": {0: "batch", 1: "sequence"},
+        }
+        torch.onnx.export(
+            export_model,
+            (dummy["input_ids"], dummy["attention_mask"]),
+            model_path,
+            input_names=["input_ids", "attention_mask"],
+            output_names=["last_hidden_state"],
+            dynamic_axes=dynamic_axes,
+            opset_version=17,
+        )
+
+    def encode(self, sentences: List[str], batch_size: int = 64, **kwargs) -> torch.Tensor:
+        """Return mean-pooled, unnormalized float32 embeddings.
+
+        Matches ``SentenceTransformer.encode(..., convert_to_tensor=True)``;
+        other keyword arguments are accepted and ignored. Sentences are
+        batched in order of token length so each batch pads only to the
+        length of similar-sized neighbours, then returned in input order.
+        """
+        if not sentences:
+            return torch.empty((0, 0), dtype=torch.float32)
+
+        encoded = self.tokenizer(
+            sentences,
+            truncation=True,
+            max_length=self.max_seq_length,
+            return_attention_mask=False,
+            return_token_type_ids=False,
+        )["input_ids"]
+        order = np.argsort([len(ids) for ids in encoded], kind="stable")
+
+        batches = []
+        for start in range(0, len(order), batch_size):
+            features = self.tokenizer.pad(
+                {"input_ids": [encoded[i] for i in order[start:start + batch_size]]},
+                return_tensors="np",
+            )
+            input_ids = features["input_ids"].astype(np.int64)
+            attention_mask = features["attention_mask"].astype(np.int64)
+            (hidden,) = self.session.run(
+                ["last_hidden_state"],
+                {"input_ids": input_ids, "attention_mask": attention_mask},
+            )
+            mask = attention_mask[..., None].astype(np.float32)
+            summed = (hidden * mask).sum(axis=1)
+            counts = np.clip(mask.sum(axis=1), 1e-9, None)
+            batches.append(summed / counts)
+
+        # Undo the length sort
+        pooled = np.concatenate(batches).astype(np.float32, copy=False)
+        embeddings = np.empty_like(pooled)
+        embeddings[order] = pooled
+        return torch.from_numpy(embeddings)
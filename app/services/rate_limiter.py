@@ -0,0 +1,38 @@
+"""Async token-bucket rate limiter for outbound API calls."""
+
+import asyncio
+import time
+
+
+class AsyncTokenBucket:
+    """Token bucket refilled continuously at ``capacity`` tokens per ``period`` seconds.
+
+    ``acquire`` waits until enough tokens are available, so callers are
+    throttled before a request is sent rather than after the API rejects it.
+    Waiters are served in arrival order.
+    """
+
+    def __init__(self, capacity: float, period: float = 60.0) -> None:
+        if capacity <= 0 or period <= 0:
+            raise ValueError("capacity and period must be positive")
+        self.capacity = capacity
+        self.rate = capacity / period
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self, amount: float = 1) -> None:
+        """Take ``amount`` tokens, waiting for the bucket to refill if needed.
+
+        Requests larger than the bucket are capped at its capacity.
+        """
+        amount = min(amount, self.capacity)
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= amount:
+                    self._tokens -= amount
+                    return
+                await asyncio.sleep((amount - self._tokens) / self.rate)
@@ -1,14 +1,68 @@
+import heapq
+import time
+from collections import deque
+from dataclasses import asdict, dataclass, field, fields
 from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional
+from typing import Any, Deque, Dict, List, Optional, Set, Tuple, Union
 
+import numpy as np
+from apscheduler.jobstores.memory import MemoryJobStore
 from apscheduler.schedulers.background import BackgroundScheduler
 from apscheduler.triggers.cron import CronTrigger
 from apscheduler.triggers.date import DateTrigger
 from apscheduler.triggers.interval import IntervalTrigger
 from apscheduler.events import EVENT_JOB_ERROR, EVENT_JOB_EXECUTED
 
+from ._fastpath import bumped_priorities, deadline_timestamp
 from .ai_engine import AIEngine
 
+# Statuses whose expired deadline entries are not kept in the heap
+_CLOSED_STATUSES = frozenset({"done", "overdue"})
+
+
+@dataclass(slots=True)
+class TaskRecord:
+    """A task held in the scheduler's in-memory registry.
+
+    Slotted, so records carry no per-instance ``__dict__``. The trailing
+    fields are maintained by TaskScheduler and not set by callers.
+    """
+
+    id: str
+    title: str = ""
+    description: str = ""
+    priority: int = 3  # 1 (highest) ... 5 (lowest)
+    deadline: Optional[Union[datetime, str]] = None
+    estimated_duration: Optional[int] = None  # minutes
+    status: str = "pending"  # e.g., "pending", "in_progress", "done"
+    tags: List[str] = field(default_factory=list)
+    assignee: Optional[str] = None
+    metadata: Dict[str, Any] = field(default_factory=dict)
+
+    # Priority before urgency bumps, as registered or last set
+    base_priority: int = field(default=3, init=False, repr=False)
+    # Unix timestamp of ``deadline``
+    deadline_ts: Optional[float] = field(default=None, init=False, repr=False)
+    # When the urgency bump next changes
+    next_recalc: Optional[float] = field(default=None, init=False, repr=False)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "TaskRecord":
+        """Build a record from a task dict; unknown keys go into ``metadata``."""
+        if "id" not in data:
+            raise ValueError("Task must include an 'id'")
+        names = {f.name for f in fields(cls) if f.init}
+        record = cls(**{k: v for k, v in data.items() if k in names})
+        record.metadata.update({k: v for k, v in data.items() if k not in names})
+        return record
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Public fields as a plain dict, for the AI engine and serialization."""
+        data = asdict(self)
+        for name in ("base_priority", "deadline_ts", "next_recalc"):
+            del data[name]
+        return data
+
 
 class TaskScheduler:
     """
@@ -20,32 +74,36 @@ class TaskScheduler:
     - Dynamic priority recalculation
     - AI-powered task suggestions via AIEngine
 
-    Expected task schema (example):
-    {
-        "id": str,
-        "title": str,
-        "description": str,
-        "priority": int,               # 1 (highest) ... 5 (lowest)
-        "deadline": Optional[datetime],
-        "estimated_duration": Optional[int],  # minutes
-        "status": str,                 # e.g., "pending", "in_progress", "done"
-        "tags": List[str],
-        "assignee": Optional[str],
-        "metadata": Dict[str, Any],
-    }
+    Tasks are stored as TaskRecord instances; ``register_task`` also accepts
+    a dict with the same keys.
+
+    Deadlines are parsed once at registration into Unix timestamps
+    (naive datetimes are taken as UTC) and indexed in heaps, so the
+    housekeeping jobs only touch tasks that expire or change urgency band
+    instead of scanning every task. Change tasks through ``update_task`` so
+    the indexes stay in sync.
     """
 
     def __init__(self, ai_engine: Optional[AIEngine] = None, timezone: Optional[str] = None) -> None:
-        self.scheduler = BackgroundScheduler(timezone=timezone)
+        # Jobs hold bound methods and closures, so they stay in memory; job
+        # outcomes go to _exec_log rather than back into the jobstore
+        self.scheduler = BackgroundScheduler(jobstores={"default": MemoryJobStore()}, timezone=timezone)
         self.ai_engine = ai_engine or AIEngine()
         self._started = False
 
         # In-memory task registry (replace with DB/service integration as needed)
-        self.tasks: Dict[str, Dict[str, Any]] = {}
+        self.tasks: Dict[str, TaskRecord] = {}
+        # (deadline, task_id) for overdue detection
+        self._deadline_heap: List[Tuple[float, str]] = []
+        # (time the urgency bump next changes, task_id)
+        self._priority_heap: List[Tuple[float, str]] = []
+        # Tasks whose priority must be recomputed on the next tick
+        self._dirty: Set[str] = set()
+        # Most recent job outcomes: (job_id, timestamp, retval or exception text, ok)
+        self._exec_log: Deque[Tuple[str, float, Any, bool]] = deque(maxlen=10_000)
 
-        # Attach listeners
-        self.scheduler.add_listener(self._on_job_executed, EVENT_JOB_EXECUTED)
-        self.scheduler.add_listener(self._on_job_error, EVENT_JOB_ERROR)
+        # Attach listener
+        self.scheduler.add_listener(self._on_job_event, EVENT_JOB_EXECUTED | EVENT_JOB_ERROR)
 
     # -------------------- Lifecycle --------------------
     def start(self) -> None:
@@ -60,18 +118,38 @@ class TaskScheduler:
             self._started = False
 
     # -------------------- Public API --------------------
-    def register_task(self, task: Dict[str, Any]) -> None:
-        if "id" not in task:
-            raise ValueError("Task must include an 'id'")
-        # Normalize
-        task.setdefault("priority", 3)
-        task.setdefault("status", "pending")
-        task.setdefault("tags", [])
-        task.setdefault("metadata", {})
-        self.tasks[task["id"]] = task
+    def register_task(self, task: Union[TaskRecord, Dict[str, Any]]) -> TaskRecord:
+        if not isinstance(task, TaskRecord):
+            task = TaskRecord.from_dict(task)
+        task.base_priority = int(task.priority)
+        self.tasks[task.id] = task
+        self._index_deadline(task)
+        self._dirty.add(task.id)
+        return task
+
+    def update_task(self, task_id: str, **changes: Any) -> None:
+        task = self.tasks.get(task_id)
+        if task is None:
+            raise KeyError(task_id)
+        was_closed = task.status in _CLOSED_STATUSES
+        for name, value in changes.items():
+            setattr(task, name, value)
+        if "priority" in changes:
+            task.base_priority = int(changes["priority"])
+        if "deadline" in changes:
+            self._index_deadline(task)
+        elif was_closed and task.status not in _CLOSED_STATUSES:
+            # Expired entries are dropped once popped, so a reopened task
+            # needs its deadline queued again to be flagged overdue. Entries
+            # for deadlines still in the future are still in the heap.
+            if task.deadline_ts is not None and task.deadline_ts < time.time():
+                heapq.heappush(self._deadline_heap, (task.deadline_ts, task.id))
+        self._dirty.add(task_id)
 
     def remove_task(self, task_id: str) -> None:
+        # Heap entries for the task are dropped lazily when popped
         self.tasks.pop(task_id, None)
+        self._dirty.discard(task_id)
 
     def schedule_once(self, func, run_at: datetime, job_id: Optional[str] = None, **kwargs) -> None:
         trigger = DateTrigger(run_date=run_at)
@@ -100,83 +178,100 @@ class TaskScheduler:
         self.schedule_interval(self._generate_ai_suggestions, seconds=3600, job_id="housekeeping:ai_suggestions")
 
     def _check_deadlines(self) -> None:
-        now = datetime.utcnow()
-        for t in self.tasks.values():
-            deadline = t.get("deadline")
-            status = t.get("status")
-            if not deadline or status == "done":
+        now_ts = time.time()
+        overdue_since = None
+        heap = self._deadline_heap
+        while heap and heap[0][0] < now_ts:
+            deadline_ts, task_id = heapq.heappop(heap)
+            t = self.tasks.get(task_id)
+            # Skip entries left behind by removed tasks or changed deadlines
+            if t is None or t.deadline_ts != deadline_ts:
                 continue
-            if isinstance(deadline, str):
-                try:
-                    deadline = datetime.fromisoformat(deadline)
-                except Exception:
-                    continue
             # Mark overdue
-            if deadline < now and status not in {"overdue", "done"}:
-                t["status"] = "overdue"
-                t.setdefault("metadata", {})
-                t["metadata"]["overdue_since"] = now.isoformat()
+            if t.status not in _CLOSED_STATUSES:
+                if overdue_since is None:
+                    overdue_since = datetime.utcfromtimestamp(now_ts).isoformat()
+                t.status = "overdue"
+                t.metadata["overdue_since"] = overdue_since
 
     def _recalculate_priorities(self) -> None:
-        now = datetime.utcnow()
-        for t in self.tasks.values():
-            if t.get("status") == "done":
-                continue
-            base = int(t.get("priority", 3))
-            deadline = t.get("deadline")
-            if isinstance(deadline, str):
-                try:
-                    deadline = datetime.fromisoformat(deadline)
-                except Exception:
-                    deadline = None
-            urgency_bump = 0
-            if deadline:
-                delta = (deadline - now).total_seconds()
-                if delta <= 0:
-                    urgency_bump = -2  # push toward highest urgency
-                elif delta < 3600:  # < 1 hour
-                    urgency_bump = -1
-                elif delta < 24 * 3600:  # < 24 hours
-                    urgency_bump = 0
-                else:
-                    urgency_bump = 1  # can relax priority slightly
-            # Keep within 1..5 (1 highest)
-            new_priority = max(1, min(5, base + urgency_bump))
-            t["priority"] = new_priority
+        now_ts = time.time()
+        heap = self._priority_heap
+        while heap and heap[0][0] <= now_ts:
+            at, task_id = heapq.heappop(heap)
+            t = self.tasks.get(task_id)
+            if t is not None and t.next_recalc == at:
+                self._dirty.add(task_id)
+
+        dirty, self._dirty = self._dirty, set()
+        batch = [self.tasks[task_id] for task_id in dirty if task_id in self.tasks]
+        batch = [t for t in batch if t.status != "done"]
+        if not batch:
+            return
+
+        count = len(batch)
+        base = np.fromiter((t.base_priority for t in batch), dtype=np.int64, count=count)
+        deadlines = np.fromiter(
+            (np.nan if t.deadline_ts is None else t.deadline_ts for t in batch),
+            dtype=np.float64,
+            count=count,
+        )
+        # The bump applies to the registered priority, not the current one
+        priorities, next_recalc = bumped_priorities(base, deadlines, now_ts)
+
+        for t, priority, at in zip(batch, priorities.tolist(), next_recalc.tolist()):
+            if t.priority != priority:
+                t.priority = priority
+            if at == np.inf:
+                t.next_recalc = None
+            else:
+                t.next_recalc = at
+                heapq.heappush(heap, (at, t.id))
+
+    def _index_deadline(self, task: TaskRecord) -> None:
+        task.deadline_ts = deadline_timestamp(task.deadline)
+        task.next_recalc = None
+        if task.deadline_ts is not None:
+            heapq.heappush(self._deadline_heap, (task.deadline_ts, task.id))
 
     def _generate_ai_suggestions(self) -> None:
         try:
-            pending_tasks = [t for t in self.tasks.values() if t.get("status") != "done"]
-            suggestions = self.ai_engine.suggest_next_actions(pending_tasks)
+            pending_tasks = [t for t in self.tasks.values() if t.status != "done"]
+            suggestions = self.ai_engine.suggest_next_actions([t.to_dict() for t in pending_tasks])
             # Attach suggestions to metadata
             for t in pending_tasks:
-                t.setdefault("metadata", {})
-                t["metadata"]["ai_suggestions"] = suggestions.get(t.get("id")) if isinstance(suggestions, dict) else suggestions
+                t.metadata["ai_suggestions"] = suggestions.get(t.id) if isinstance(suggestions, dict) else suggestions
         except Exception as e:
             # Log or store error for observability; for now, embed in metadata
             for t in self.tasks.values():
-                t.setdefault("metadata", {})
-                t["metadata"]["ai_suggestions_error"] = str(e)
+                t.metadata["ai_suggestions_error"] = str(e)
 
     # -------------------- Listeners --------------------
-    def _on_job_executed(self, event) -> None:
-        job = self.scheduler.get_job(event.job_id)
-        if not job:
-            return
-        # basic execution logging in metadata store
-        meta = getattr(job, "kwargs", {}) or {}
-        meta["last_run_at"] = datetime.utcnow().isoformat()
-        meta["result"] = getattr(event, "retval", None)
-        job.modify(kwargs=meta)
-
-    def _on_job_error(self, event) -> None:
-        job = self.scheduler.get_job(event.job_id)
-        if not job:
-            return
-        meta = getattr(job, "kwargs", {}) or {}
-        meta["last_error_at"] = datetime.utcnow().isoformat()
-        meta["exception"] = str(getattr(event, "exception", ""))
-        job.modify(kwargs=meta)
+    def _on_job_event(self, event) -> None:
+        # Append-only; rewriting the job's kwargs would persist to the jobstore
+        # on every run and clobber the arguments of the next run
+        if event.exception is None:
+            self._exec_log.append((event.job_id, time.time(), event.retval, True))
+        else:
+            self._exec_log.append((event.job_id, time.time(), str(event.exception), False))
+
+    def job_history(self, job_id: Optional[str] = None, limit: int = 100) -> List[Dict[str, Any]]:
+        """Return up to ``limit`` recent executions, newest first, optionally for one job."""
+        history = []
+        for entry_job_id, ts, result, ok in reversed(self._exec_log):
+            if job_id is not None and entry_job_id != job_id:
+                continue
+            entry = {"job_id": entry_job_id, "ok": ok}
+            if ok:
+                entry["last_run_at"] = datetime.utcfromtimestamp(ts).isoformat()
+                entry["result"] = result
+            else:
+                entry["last_error_at"] = datetime.utcfromtimestamp(ts).isoformat()
+                entry["exception"] = result
+            history.append(entry)
+            if len(history) >= limit:
+                break
+        return history
 
     # -------------------- Utilities --------------------
     def suggest_schedule_for_task(self, task_id: str) -> Optional[Dict[str, Any]]:
@@ -185,7 +280,7 @@ class TaskScheduler:
         if not task:
             return None
         try:
-            proposal = self.ai_engine.propose_schedule(task)
+            proposal = self.ai_engine.propose_schedule(task.to_dict())
             return proposal
         except Exception:
             return None
@@ -209,8 +304,7 @@ class TaskScheduler:
             # Placeholder execution for a scheduled task hook
             t = self.tasks.get(task_id)
             if t:
-                t.setdefault("metadata", {})
-                t["metadata"]["executed_at"] = datetime.utcnow().isoformat()
+                t.metadata["executed_at"] = datetime.utcnow().isoformat()
 
         job_id = f"task:{task_id}:once"
         self.schedule_once(noop, run_at, job_id=job_id, task_id=task_id)
@@ -0,0 +1,134 @@
+from types import SimpleNamespace
+
+import httpx
+import openai
+import pytest
+
+from app.services import ai_engine
+from app.services.ai_engine import AIEngine
+
+
+@pytest.fixture
+def engine():
+    return AIEngine()
+
+
+def titles(engine: AIEngine, text: str):
+    return [subtask["title"] for subtask in engine._parse_subtasks(text)]
+
+
+def test_parse_subtasks_accepts_bullets_and_numbers(engine):
+    text = "Here you go:\n1. Draft outline\n2)  Review  \n - Ship it\r\n* Celebrate\n10. Last one\n"
+
+    assert titles(engine, text) == ["Draft outline", "Review", "Ship it", "Celebrate", "Last one"]
+    assert all(s["status"] == "pending" for s in engine._parse_subtasks(text))
+
+
+def test_parse_subtasks_skips_empty_bullets_and_rules(engine):
+    text = "- \n2.   \n---\n***\n* - \n- Fix -- bugs\n"
+
+    assert titles(engine, text) == ["Fix -- bugs"]
+
+
+def test_parse_subtasks_ignores_unmarked_lines(engine):
+    assert titles(engine, "2024 roadmap\nNo list here\n") == []
+
+
+def test_parse_subtasks_ignores_bold_headers_and_emphasis(engine):
+    text = "**Subtasks:**\n- Plan\n*Note: adjust as needed*\n*italic line*\n"
+
+    assert titles(engine, text) == ["Plan"]
+
+
+def test_parse_subtasks_ignores_decimals(engine):
+    text = "1.5 hours buffer\n2.25\n3. Test\n"
+
+    assert titles(engine, text) == ["Test"]
+
+
+class FakeCompletions:
+    def __init__(self, outcomes):
+        self.outcomes = list(outcomes)
+        self.calls = 0
+
+    async def create(self, **kwargs):
+        self.calls += 1
+        outcome = self.outcomes.pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+
+def fake_client(outcomes):
+    completions = FakeCompletions(outcomes)
+    return SimpleNamespace(chat=SimpleNamespace(completions=completions)), completions
+
+
+def api_error(cls):
+    request = httpx.Request("POST", "https://api.openai.com/v1/chat/completions")
+    if issubclass(cls, openai.APIConnectionError):
+        return cls(request=request)
+    status = 429 if cls is openai.RateLimitError else 500
+    return cls("failed", response=httpx.Response(status, request=request), body=None)
+
+
+@pytest.fixture
+def no_backoff(monkeypatch):
+    monkeypatch.setattr(ai_engine.random, "uniform", lambda a, b: 0.0)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "error",
+    [openai.RateLimitError, openai.APIConnectionError, openai.APITimeoutError, openai.InternalServerError],
+)
+async def test_chat_completion_retries_transient_errors(engine, no_backoff, error):
+    engine.client, completions = fake_client([api_error(error), "ok"])
+
+    result = await engine._chat_completion(messages=[{"role": "user", "content": "hi"}], max_tokens=5)
+
+    assert result == "ok"
+    assert completions.calls == 2
+
+
+@pytest.mark.asyncio
+async def test_chat_completion_gives_up_after_max_retries(engine, no_backoff, monkeypatch):
+    monkeypatch.setattr(ai_engine.settings, "OPENAI_MAX_RETRIES", 2)
+    engine.client, completions = fake_client([api_error(openai.InternalServerError)] * 3)
+
+    with pytest.raises(openai.InternalServerError):
+        await engine._chat_completion(messages=[{"role": "user", "content": "hi"}], max_tokens=5)
+    assert completions.calls == 3
+
+
+@pytest.mark.asyncio
+async def test_chat_completion_does_not_retry_client_errors(engine, no_backoff):
+    request = httpx.Request("POST", "https://api.openai.com/v1/chat/completions")
+    bad_request = openai.BadRequestError("bad", response=httpx.Response(400, request=request), body=None)
+    engine.client, completions = fake_client([bad_request, "ok"])
+
+    with pytest.raises(openai.BadRequestError):
+        await engine._chat_completion(messages=[{"role": "user", "content": "hi"}], max_tokens=5)
+    assert completions.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_failed_load_is_recorded_and_not_retried(engine, monkeypatch):
+    attempts = []
+
+    def broken_client(**kwargs):
+        attempts.append(kwargs)
+        raise RuntimeError("no weights")
+
+    monkeypatch.setattr(ai_engine, "AsyncOpenAI", broken_client)
+    assert engine.status == "loading"
+
+    for _ in range(3):
+        with pytest.raises(RuntimeError, match="no weights"):
+            await engine.initialize()
+
+    assert len(attempts) == 1
+    assert engine.start_loading() is engine._init_task
+    assert isinstance(engine.load_error, RuntimeError)
+    assert engine.status == "failed"
+    await engine.close()
@@ -0,0 +1,80 @@
+import asyncio
+import time
+
+import pytest
+
+from app.services.batcher import MicroBatcher
+
+
+class Recorder:
+    def __init__(self, delay: float = 0.0, fail_on=None):
+        self.batches = []
+        self.delay = delay
+        self.fail_on = fail_on
+
+    async def __call__(self, items):
+        self.batches.append(list(items))
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        if self.fail_on in items:
+            raise RuntimeError("model failed")
+        return [item * 2 for item in items]
+
+
+def test_rejects_empty_batches():
+    with pytest.raises(ValueError):
+        MicroBatcher(Recorder(), max_batch=0)
+
+
+@pytest.mark.asyncio
+async def test_concurrent_submits_share_batches_and_keep_order():
+    process = Recorder()
+    batcher = MicroBatcher(process, max_batch=4, max_wait_ms=50)
+
+    results = await asyncio.gather(*(batcher.submit(i) for i in range(10)))
+
+    assert results == [i * 2 for i in range(10)]
+    assert [len(b) for b in process.batches] == [4, 4, 2]
+    await batcher.close()
+
+
+@pytest.mark.asyncio
+async def test_partial_batch_is_flushed_after_max_wait():
+    process = Recorder()
+    batcher = MicroBatcher(process, max_batch=32, max_wait_ms=20)
+
+    start = time.monotonic()
+    assert await batcher.submit(3) == 6
+    elapsed = time.monotonic() - start
+
+    assert process.batches == [[3]]
+    assert 0.015 <= elapsed < 0.5
+    await batcher.close()
+
+
+@pytest.mark.asyncio
+async def test_batch_error_reaches_every_caller_and_worker_survives():
+    process = Recorder(fail_on=2)
+    batcher = MicroBatcher(process, max_batch=4, max_wait_ms=20)
+
+    results = await asyncio.gather(*(batcher.submit(i) for i in range(3)), return_exceptions=True)
+
+    assert all(isinstance(r, RuntimeError) for r in results)
+    assert await batcher.submit(5) == 10
+    await batcher.close()
+
+
+@pytest.mark.asyncio
+async def test_close_cancels_in_flight_and_queued_requests():
+    process = Recorder(delay=10)
+    batcher = MicroBatcher(process, max_batch=2, max_wait_ms=1)
+
+    submits = [asyncio.create_task(batcher.submit(i)) for i in range(4)]
+    while not process.batches:
+        await asyncio.sleep(0.005)
+
+    await batcher.close()
+    results = await asyncio.wait_for(asyncio.gather(*submits, return_exceptions=True), timeout=1.0)
+
+    assert process.batches == [[0, 1]]
+    assert all(isinstance(r, asyncio.CancelledError) for r in results)
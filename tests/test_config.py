@@ -0,0 +1,103 @@
+import os
+
+import pytest
+
+from app.core._env_compile import compile_env, compiled_path, load_compiled_env
+from app.core.config import Settings, _LazyField
+
+
+@pytest.fixture
+def env_file(tmp_path, monkeypatch):
+    monkeypatch.delenv("PORT", raising=False)
+    monkeypatch.delenv("PROJECT_NAME", raising=False)
+    monkeypatch.delenv("DEBUG", raising=False)
+    path = tmp_path / ".env"
+    path.write_text("PORT=9000\nPROJECT_NAME=From file\n")
+    return str(path)
+
+
+def test_environment_wins_over_env_file_and_default(env_file, monkeypatch):
+    monkeypatch.setenv("PORT", "9100")
+    settings = Settings(env_file=env_file)
+
+    assert settings.PORT == 9100
+    assert settings.PROJECT_NAME == "From file"
+    assert settings.HOST == "0.0.0.0"
+
+
+def test_values_are_cast(env_file, monkeypatch):
+    monkeypatch.setenv("DEBUG", "off")
+    settings = Settings(env_file=env_file)
+
+    assert settings.DEBUG is False
+    assert settings.PORT == 9000
+
+
+@pytest.mark.parametrize("raw", ["maybe", "2"])
+def test_invalid_bool_is_rejected(env_file, monkeypatch, raw):
+    monkeypatch.setenv("DEBUG", raw)
+
+    with pytest.raises(ValueError, match="Invalid value for DEBUG"):
+        Settings(env_file=env_file).DEBUG
+
+
+@pytest.mark.parametrize(
+    "name, raw, message",
+    [
+        ("OPENAI_MAX_CONCURRENT", "0", "greater than or equal to 1"),
+        ("AI_MODEL_TEMPERATURE", "2.5", "less than or equal to 2.0"),
+    ],
+)
+def test_bounds_are_enforced(monkeypatch, name, raw, message):
+    monkeypatch.setenv(name, raw)
+
+    with pytest.raises(ValueError, match=message):
+        getattr(Settings(env_file=None), name)
+
+
+def test_validate_all_surfaces_errors_eagerly(monkeypatch):
+    monkeypatch.setenv("LOG_LEVEL", "LOUD")
+
+    with pytest.raises(ValueError, match="Invalid value for LOG_LEVEL"):
+        Settings(env_file=None).validate_all()
+
+
+def test_subclass_validates_inherited_and_own_fields(monkeypatch):
+    class ExtraSettings(Settings):
+        EXTRA: int = _LazyField(default=1, caster=int, ge=1)
+
+    assert "PORT" in ExtraSettings._field_names
+    assert "EXTRA" in ExtraSettings._field_names
+    assert "EXTRA" not in Settings._field_names
+
+    monkeypatch.setenv("EXTRA", "0")
+    with pytest.raises(ValueError, match="Invalid value for EXTRA"):
+        ExtraSettings(env_file=None).validate_all()
+
+    monkeypatch.setenv("EXTRA", "2")
+    monkeypatch.setenv("LOG_LEVEL", "LOUD")
+    with pytest.raises(ValueError, match="Invalid value for LOG_LEVEL"):
+        ExtraSettings(env_file=None).validate_all()
+
+
+def test_compiled_env_is_used_while_fresh(env_file):
+    compile_env(env_file)
+
+    assert os.path.isfile(compiled_path(env_file))
+    assert load_compiled_env(env_file) == {"PORT": "9000", "PROJECT_NAME": "From file"}
+    assert Settings(env_file=env_file).PORT == 9000
+
+
+def test_stale_compiled_env_is_ignored(env_file):
+    compile_env(env_file)
+    with open(env_file, "w") as f:
+        f.write("PORT=9200\n")
+    stat = os.stat(env_file)
+    os.utime(env_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    assert load_compiled_env(env_file) is None
+    assert Settings(env_file=env_file).PORT == 9200
+
+
+def test_missing_compiled_env_returns_none(env_file):
+    assert load_compiled_env(env_file) is None
@@ -0,0 +1,80 @@
+import httpx
+import pytest
+import pytest_asyncio
+from starlette.applications import Starlette
+from starlette.responses import PlainTextResponse
+from starlette.routing import Route
+
+from app.core.cors import FastCORSMiddleware, normalize_origin
+
+
+async def ok(request):
+    return PlainTextResponse("ok")
+
+
+@pytest_asyncio.fixture
+async def client():
+    app = Starlette(routes=[Route("/", ok)])
+    app.add_middleware(
+        FastCORSMiddleware,
+        allow_origins=["http://localhost:3000", "https://App.example.com/"],
+        allow_credentials=True,
+        allow_methods=["*"],
+        allow_headers=["*"],
+    )
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://testserver") as client:
+        yield client
+
+
+def test_normalize_origin():
+    assert normalize_origin("HTTPS://App.Example.com/") == "https://app.example.com"
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "origin",
+    ["http://localhost:3000", "HTTP://LOCALHOST:3000", "http://localhost:3000/", "https://app.example.com"],
+)
+async def test_allowed_origin_is_echoed(client, origin):
+    response = await client.get("/", headers={"Origin": origin})
+
+    assert response.status_code == 200
+    assert response.headers["access-control-allow-origin"] == origin
+    assert response.headers["access-control-allow-credentials"] == "true"
+
+
+@pytest.mark.asyncio
+async def test_disallowed_origin_gets_no_cors_headers(client):
+    response = await client.get("/", headers={"Origin": "http://evil.example.com"})
+
+    assert response.status_code == 200
+    assert "access-control-allow-origin" not in response.headers
+
+
+@pytest.mark.asyncio
+async def test_preflight_from_allowed_origin(client):
+    response = await client.options(
+        "/",
+        headers={
+            "Origin": "http://localhost:3000/",
+            "Access-Control-Request-Method": "POST",
+            "Access-Control-Request-Headers": "Authorization",
+        },
+    )
+
+    assert response.status_code == 200
+    assert response.headers["access-control-allow-origin"] == "http://localhost:3000/"
+    assert "POST" in response.headers["access-control-allow-methods"]
+    assert response.headers["access-control-allow-headers"] == "Authorization"
+
+
+@pytest.mark.asyncio
+async def test_preflight_from_disallowed_origin_is_rejected(client):
+    response = await client.options(
+        "/",
+        headers={"Origin": "http://evil.example.com", "Access-Control-Request-Method": "POST"},
+    )
+
+    assert response.status_code == 400
+    assert "access-control-allow-origin" not in response.headers
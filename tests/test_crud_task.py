@@ -0,0 +1,82 @@
+from types import SimpleNamespace
+
+import pytest
+
+from app.crud import task as crud_task
+from app.crud.task import task_crud
+from app.models.task import Task
+from app.schemas.task import TaskCreate
+
+
+class FakeSession:
+    def __init__(self, row=None):
+        self.row = row
+        self.deleted = []
+
+    def add(self, obj):
+        pass
+
+    async def commit(self):
+        pass
+
+    async def refresh(self, obj):
+        if obj.project_id is None:
+            obj.project_id = 3
+
+    async def execute(self, stmt):
+        return SimpleNamespace(scalar_one_or_none=lambda: self.row)
+
+    async def delete(self, obj):
+        self.deleted.append(obj)
+
+
+@pytest.fixture
+def invalidated(monkeypatch):
+    calls = []
+
+    async def record(*project_ids):
+        calls.append(project_ids)
+
+    monkeypatch.setattr(crud_task, "invalidate_project_stats", record)
+    return calls
+
+
+@pytest.mark.asyncio
+async def test_create_invalidates_project_stats(invalidated):
+    task = await task_crud.create(FakeSession(), obj_in=TaskCreate(title="Write"))
+
+    assert task.project_id == 3
+    assert invalidated == [(3,)]
+
+
+@pytest.mark.asyncio
+async def test_create_with_owner_invalidates_project_stats(invalidated):
+    task = await task_crud.create_with_owner(FakeSession(), obj_in=TaskCreate(title="Write"), owner_id=7)
+
+    assert task.user_id == 7
+    assert invalidated == [(3,)]
+
+
+@pytest.mark.asyncio
+async def test_update_invalidates_old_and_new_project(invalidated):
+    task = Task(title="Write", project_id=3)
+
+    await task_crud.update(FakeSession(), db_obj=task, obj_in={"project_id": 5})
+
+    assert invalidated == [(3, 5)]
+
+
+@pytest.mark.asyncio
+async def test_remove_invalidates_project_stats(invalidated):
+    task = Task(title="Write", project_id=3)
+    db = FakeSession(row=task)
+
+    assert await task_crud.remove(db, id=1) is task
+    assert db.deleted == [task]
+    assert invalidated == [(3,)]
+
+
+@pytest.mark.asyncio
+async def test_removing_a_missing_task_does_not_invalidate(invalidated):
+    assert await task_crud.remove(FakeSession(), id=1) is None
+    assert invalidated == []
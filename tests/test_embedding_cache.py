@@ -0,0 +1,79 @@
+import numpy as np
+
+from app.services.embedding_cache import EmbeddingCache, LRUCache, text_key
+
+
+def test_text_key_ignores_whitespace_differences():
+    assert text_key("Fix  the\tbug\n") == text_key(" Fix the bug")
+    assert text_key("Fix the bug") != text_key("Fix the bugs")
+
+
+def test_text_key_is_a_stable_16_byte_digest():
+    key = text_key("Fix the bug")
+
+    assert isinstance(key, bytes)
+    assert len(key) == 16
+    assert key == text_key("Fix the bug")
+
+
+def test_lru_evicts_least_recently_used():
+    cache = LRUCache(maxsize=2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    cache.get("a")
+
+    cache.put("c", 3)
+
+    assert len(cache) == 2
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+
+
+def test_lru_put_refreshes_existing_keys():
+    cache = LRUCache(maxsize=2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    cache.put("a", 10)
+
+    cache.put("c", 3)
+
+    assert cache.get("a") == 10
+    assert cache.get("b") is None
+
+
+def test_embedding_cache_reports_misses():
+    cache = EmbeddingCache(maxsize=4)
+    cache.put_many([b"a"], np.ones((1, 3)))
+
+    hit, miss = cache.get_many([b"a", b"b"])
+
+    assert hit.dtype == np.float32
+    assert np.array_equal(hit, np.ones(3))
+    assert miss is None
+
+
+def test_embeddings_persist_across_instances(tmp_path):
+    path = str(tmp_path / "embeddings.sqlite")
+    keys = [text_key("one"), text_key("two")]
+    vectors = np.arange(6, dtype=np.float32).reshape(2, 3)
+
+    first = EmbeddingCache(maxsize=4, path=path)
+    first.put_many(keys, vectors)
+    first.close()
+
+    second = EmbeddingCache(maxsize=4, path=path)
+    loaded = second.get_many(keys + [text_key("three")])
+    second.close()
+
+    assert np.array_equal(loaded[0], vectors[0])
+    assert np.array_equal(loaded[1], vectors[1])
+    assert loaded[2] is None
+
+
+def test_evicted_embeddings_are_reloaded_from_disk(tmp_path):
+    cache = EmbeddingCache(maxsize=1, path=str(tmp_path / "embeddings.sqlite"))
+    cache.put_many([b"a", b"b"], np.eye(2))
+
+    assert np.array_equal(cache.get_many([b"a"])[0], [1.0, 0.0])
+    cache.close()
@@ -0,0 +1,93 @@
+import base64
+import json
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from app.core.pagination import decode_cursor, encode_cursor
+from app.crud.task import task_crud
+
+
+@pytest.mark.parametrize(
+    "key",
+    [
+        (datetime(2024, 5, 1, 12, 30, 15, 123456), 42),
+        (datetime(2024, 5, 1, 12, 30, tzinfo=timezone.utc), 1),
+    ],
+)
+def test_cursor_round_trip(key):
+    cursor = encode_cursor(key)
+
+    assert decode_cursor(cursor) == key
+    assert decode_cursor(cursor)[0].tzinfo == key[0].tzinfo
+
+
+def test_cursor_is_url_safe():
+    cursor = encode_cursor((datetime(2024, 5, 1), 2**40))
+
+    assert set(cursor) <= set("ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789-_=")
+
+
+def b64(value) -> str:
+    return base64.urlsafe_b64encode(json.dumps(value).encode()).decode()
+
+
+@pytest.mark.parametrize(
+    "cursor",
+    [
+        "not a cursor",
+        base64.urlsafe_b64encode(b"not json").decode(),
+        b64(["2024-05-01T12:00:00"]),
+        b64(["2024-05-01T12:00:00", 1, 2]),
+        b64(["yesterday", 1]),
+        b64(["2024-05-01T12:00:00", "one"]),
+        b64([None, 1]),
+        b64({"at": "2024-05-01T12:00:00", "id": 1}),
+    ],
+)
+def test_decode_cursor_rejects_malformed_input(cursor):
+    with pytest.raises(ValueError, match="Invalid pagination cursor"):
+        decode_cursor(cursor)
+
+
+class FakeSession:
+    def __init__(self, rows):
+        self.rows = rows
+        self.statements = []
+
+    async def execute(self, stmt):
+        self.statements.append(stmt)
+        return SimpleNamespace(scalars=lambda: SimpleNamespace(all=lambda: self.rows))
+
+
+def compiled(stmt) -> str:
+    return str(stmt.compile(dialect=postgresql.dialect()))
+
+
+@pytest.mark.asyncio
+async def test_owner_page_seeks_past_the_cursor():
+    rows = [SimpleNamespace(created_at=datetime(2024, 5, i + 1), id=i) for i in range(2)]
+    db = FakeSession(rows)
+
+    tasks, next_cursor = await task_crud.get_multi_by_owner(
+        db, owner_id=7, after=(datetime(2024, 4, 30), 9), limit=2
+    )
+
+    sql = compiled(db.statements[0])
+    assert "(tasks.created_at, tasks.id) > (" in sql
+    assert "ORDER BY tasks.created_at, tasks.id" in sql
+    assert "OFFSET" not in sql
+    assert tasks == rows
+    assert next_cursor == (datetime(2024, 5, 2), 1)
+
+
+@pytest.mark.asyncio
+async def test_short_page_has_no_next_cursor():
+    db = FakeSession([SimpleNamespace(created_at=datetime(2024, 5, 1), id=1)])
+
+    _, next_cursor = await task_crud.get_multi_by_owner(db, owner_id=7, limit=2)
+
+    assert next_cursor is None
+    assert "(tasks.created_at, tasks.id) >" not in compiled(db.statements[0])
@@ -0,0 +1,59 @@
+import asyncio
+import time
+
+import pytest
+
+from app.services.rate_limiter import AsyncTokenBucket
+
+
+@pytest.mark.parametrize("capacity, period", [(0, 60.0), (10, 0), (-1, 1.0)])
+def test_rejects_non_positive_settings(capacity, period):
+    with pytest.raises(ValueError):
+        AsyncTokenBucket(capacity, period)
+
+
+@pytest.mark.asyncio
+async def test_full_bucket_does_not_wait():
+    bucket = AsyncTokenBucket(10, period=1.0)
+
+    start = time.monotonic()
+    await bucket.acquire(10)
+
+    assert time.monotonic() - start < 0.05
+
+
+@pytest.mark.asyncio
+async def test_empty_bucket_waits_for_refill():
+    bucket = AsyncTokenBucket(10, period=1.0)  # 10 tokens per second
+    await bucket.acquire(10)
+
+    start = time.monotonic()
+    await bucket.acquire(5)
+    elapsed = time.monotonic() - start
+
+    assert 0.4 <= elapsed < 0.9
+
+
+@pytest.mark.asyncio
+async def test_oversized_requests_are_capped_at_capacity():
+    bucket = AsyncTokenBucket(10, period=1.0)
+
+    start = time.monotonic()
+    await asyncio.wait_for(bucket.acquire(1_000), timeout=1.0)
+
+    assert time.monotonic() - start < 0.05
+
+
+@pytest.mark.asyncio
+async def test_waiters_are_served_in_arrival_order():
+    bucket = AsyncTokenBucket(20, period=1.0)
+    await bucket.acquire(20)
+    order = []
+
+    async def take(name):
+        await bucket.acquire(1)
+        order.append(name)
+
+    await asyncio.gather(*(take(i) for i in range(5)))
+
+    assert order == list(range(5))
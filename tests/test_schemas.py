@@ -0,0 +1,55 @@
+import json
+from datetime import datetime
+
+import pytest
+from pydantic import ValidationError
+
+from app.core.responses import adapter_response
+from app.models import Task, TaskPriority, TaskStatus
+from app.schemas import TaskCreate, TaskListAdapter, TaskResponse
+
+
+def make_task(**overrides) -> Task:
+    fields = dict(
+        id=1,
+        title="Write report",
+        description=None,
+        status=TaskStatus.COMPLETED,
+        priority=TaskPriority.HIGH,
+        created_at=datetime(2024, 1, 1, 9, 0),
+        updated_at=datetime(2024, 1, 2, 9, 0),
+    )
+    fields.update(overrides)
+    return Task(**fields)
+
+
+def test_task_response_validates_orm_row_with_enum_members():
+    response = TaskResponse.model_validate(make_task())
+
+    assert response.status is TaskStatus.COMPLETED
+    assert response.priority is TaskPriority.HIGH
+
+
+def test_list_adapter_serializes_enum_values():
+    rows = [make_task(), make_task(id=2, status=TaskStatus.PENDING, priority=TaskPriority.LOW)]
+
+    body = json.loads(TaskListAdapter.dump_json(TaskListAdapter.validate_python(rows)))
+
+    assert [(t["id"], t["status"], t["priority"]) for t in body] == [
+        (1, "completed", "high"),
+        (2, "pending", "low"),
+    ]
+
+
+def test_adapter_response_accepts_orm_rows():
+    response = adapter_response(TaskListAdapter, [make_task()])
+
+    assert response.media_type == "application/json"
+    assert json.loads(response.body)[0]["status"] == "completed"
+
+
+def test_task_create_accepts_plain_strings_and_rejects_unknown_values():
+    assert TaskCreate(title="x", priority="critical").priority is TaskPriority.CRITICAL
+
+    with pytest.raises(ValidationError):
+        TaskCreate(title="x", status="done")
@@ -0,0 +1,228 @@
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+import pytest
+
+from app.services import task_scheduler
+from app.services.task_scheduler import TaskRecord, TaskScheduler
+
+NOW = 1_700_000_000.0
+HOUR = 3600.0
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = SimpleNamespace(now=NOW)
+    monkeypatch.setattr(task_scheduler, "time", SimpleNamespace(time=lambda: clock.now))
+    return clock
+
+
+@pytest.fixture
+def scheduler(clock):
+    return TaskScheduler(ai_engine=object())
+
+
+def at(ts: float) -> datetime:
+    return datetime.fromtimestamp(ts, tz=timezone.utc)
+
+
+def tick(scheduler: TaskScheduler) -> None:
+    scheduler._check_deadlines()
+    scheduler._recalculate_priorities()
+
+
+def test_register_accepts_dicts_and_keeps_unknown_keys_in_metadata(scheduler):
+    record = scheduler.register_task({"id": "a", "title": "Write", "source": "email"})
+
+    assert isinstance(record, TaskRecord)
+    assert scheduler.tasks["a"] is record
+    assert record.metadata == {"source": "email"}
+
+
+def test_register_requires_id(scheduler):
+    with pytest.raises(ValueError):
+        scheduler.register_task({"title": "No id"})
+
+
+def test_naive_and_iso_deadlines_are_taken_as_utc(scheduler):
+    naive = at(NOW + HOUR).replace(tzinfo=None)
+    scheduler.register_task({"id": "a", "deadline": naive})
+    scheduler.register_task({"id": "b", "deadline": naive.isoformat()})
+
+    assert scheduler.tasks["a"].deadline_ts == NOW + HOUR
+    assert scheduler.tasks["b"].deadline_ts == NOW + HOUR
+
+
+def test_expired_tasks_are_marked_overdue(scheduler, clock):
+    scheduler.register_task({"id": "late", "deadline": at(NOW - 1)})
+    scheduler.register_task({"id": "soon", "deadline": at(NOW + HOUR)})
+    scheduler.register_task({"id": "none"})
+
+    tick(scheduler)
+
+    assert scheduler.tasks["late"].status == "overdue"
+    assert "overdue_since" in scheduler.tasks["late"].metadata
+    assert scheduler.tasks["soon"].status == "pending"
+    assert scheduler.tasks["none"].status == "pending"
+
+    clock.now = NOW + 2 * HOUR
+    tick(scheduler)
+
+    assert scheduler.tasks["soon"].status == "overdue"
+
+
+def test_done_tasks_are_not_marked_overdue(scheduler):
+    scheduler.register_task({"id": "a", "deadline": at(NOW - 1), "status": "done"})
+
+    tick(scheduler)
+
+    assert scheduler.tasks["a"].status == "done"
+
+
+def test_reopened_task_is_marked_overdue_again(scheduler):
+    scheduler.register_task({"id": "a", "deadline": at(NOW - 1)})
+    scheduler.update_task("a", status="done")
+    tick(scheduler)
+
+    scheduler.update_task("a", status="pending")
+    tick(scheduler)
+
+    task = scheduler.tasks["a"]
+    assert task.status == "overdue"
+    assert "overdue_since" in task.metadata
+    assert task.priority == 1
+
+
+def test_reopened_overdue_task_is_flagged_again(scheduler):
+    scheduler.register_task({"id": "a", "deadline": at(NOW - 1)})
+    tick(scheduler)
+    scheduler.update_task("a", status="in_progress")
+
+    tick(scheduler)
+
+    assert scheduler.tasks["a"].status == "overdue"
+
+
+def test_status_toggles_do_not_grow_the_deadline_heap(scheduler):
+    scheduler.register_task({"id": "future", "deadline": at(NOW + 48 * HOUR)})
+    scheduler.register_task({"id": "past", "deadline": at(NOW - 1)})
+    tick(scheduler)
+
+    for _ in range(50):
+        scheduler.update_task("future", status="done")
+        scheduler.update_task("future", status="pending")
+        scheduler.update_task("past", status="done")
+        scheduler.update_task("past", status="pending")
+        tick(scheduler)
+
+    assert len(scheduler._deadline_heap) == 1
+    assert scheduler.tasks["past"].status == "overdue"
+
+
+def test_moved_deadline_drops_the_stale_heap_entry(scheduler, clock):
+    scheduler.register_task({"id": "a", "deadline": at(NOW + HOUR)})
+    scheduler.update_task("a", deadline=at(NOW + 10 * HOUR))
+
+    clock.now = NOW + 2 * HOUR
+    tick(scheduler)
+
+    assert scheduler.tasks["a"].status == "pending"
+
+
+def test_removed_tasks_are_skipped(scheduler):
+    scheduler.register_task({"id": "a", "deadline": at(NOW - 1)})
+    scheduler.remove_task("a")
+
+    tick(scheduler)
+
+    assert "a" not in scheduler.tasks
+    assert scheduler._deadline_heap == []
+
+
+def test_update_unknown_task_raises(scheduler):
+    with pytest.raises(KeyError):
+        scheduler.update_task("missing", status="done")
+
+
+@pytest.mark.parametrize(
+    "offset, expected",
+    [
+        (-HOUR, 1),          # overdue: -2
+        (30 * 60, 2),        # < 1 hour: -1
+        (5 * HOUR, 3),       # < 24 hours: 0
+        (48 * HOUR, 4),      # later: +1
+        (None, 3),           # no deadline
+    ],
+)
+def test_urgency_bump(scheduler, offset, expected):
+    deadline = None if offset is None else at(NOW + offset)
+    scheduler.register_task({"id": "a", "priority": 3, "deadline": deadline})
+
+    scheduler._recalculate_priorities()
+
+    assert scheduler.tasks["a"].priority == expected
+
+
+def test_priorities_stay_within_bounds(scheduler):
+    scheduler.register_task({"id": "high", "priority": 1, "deadline": at(NOW - 1)})
+    scheduler.register_task({"id": "low", "priority": 5, "deadline": at(NOW + 48 * HOUR)})
+
+    scheduler._recalculate_priorities()
+
+    assert scheduler.tasks["high"].priority == 1
+    assert scheduler.tasks["low"].priority == 5
+
+
+def test_bump_does_not_compound_across_ticks(scheduler):
+    scheduler.register_task({"id": "a", "priority": 3, "deadline": at(NOW + 30 * 60)})
+
+    for _ in range(3):
+        scheduler.update_task("a", title="touched")
+        scheduler._recalculate_priorities()
+
+    assert scheduler.tasks["a"].priority == 2
+
+
+def test_band_crossing_recomputes_without_mutation(scheduler, clock):
+    scheduler.register_task({"id": "a", "priority": 3, "deadline": at(NOW + 48 * HOUR)})
+    scheduler._recalculate_priorities()
+    assert scheduler.tasks["a"].priority == 4
+    assert scheduler.tasks["a"].next_recalc == NOW + 24 * HOUR
+
+    # Nothing is due before the next band boundary
+    clock.now = NOW + 23 * HOUR
+    scheduler._recalculate_priorities()
+    assert scheduler.tasks["a"].priority == 4
+
+    clock.now = NOW + 24 * HOUR
+    scheduler._recalculate_priorities()
+    assert scheduler.tasks["a"].priority == 3
+    assert scheduler.tasks["a"].next_recalc == NOW + 47 * HOUR
+
+    clock.now = NOW + 48 * HOUR + 1
+    scheduler._recalculate_priorities()
+    assert scheduler.tasks["a"].priority == 1
+    assert scheduler.tasks["a"].next_recalc is None
+
+
+def test_priority_update_changes_the_base(scheduler):
+    scheduler.register_task({"id": "a", "priority": 3, "deadline": at(NOW + 30 * 60)})
+    scheduler._recalculate_priorities()
+
+    scheduler.update_task("a", priority=5)
+    scheduler._recalculate_priorities()
+
+    assert scheduler.tasks["a"].base_priority == 5
+    assert scheduler.tasks["a"].priority == 4
+
+
+def test_job_history_is_newest_first_and_filterable(scheduler, clock):
+    scheduler._on_job_event(SimpleNamespace(job_id="a", retval=1, exception=None))
+    scheduler._on_job_event(SimpleNamespace(job_id="b", retval=None, exception=RuntimeError("boom")))
+    scheduler._on_job_event(SimpleNamespace(job_id="a", retval=2, exception=None))
+
+    history = scheduler.job_history()
+    assert [(e["job_id"], e["ok"]) for e in history] == [("a", True), ("b", False), ("a", True)]
+    assert history[1]["exception"] == "boom"
+
+    assert [e["result"] for e in scheduler.job_history("a", limit=1)] == [2]